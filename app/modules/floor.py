@@ -45,7 +45,6 @@ class Floor(VGroup):
         )
         tick_offset = width / number_of_ticks
 
-        ticks = VGroup()
         labels = VGroup()
 
         for i, num in zip(range(number_of_ticks + 1), np.arange(0, width + 1, self.tick_frequency)):
@@ -54,14 +53,16 @@ class Floor(VGroup):
             label.scale(.3)
             label.shift(i * tick_offset * RIGHT)
 
-            tick = Line(
-                start=np.zeros(3),
-                end=np.array([0, -self.tick_length, 0])
-            )
-            tick.shift(i * tick_offset * RIGHT)
-
             labels.add(label)
-            ticks.add(tick)
+
+        tick = Line(
+            start=np.zeros(3),
+            end=np.array([0, -self.tick_length, 0])
+        )
+        ticks = InstancedVMobject(
+            tick,
+            shifts=[i * tick_offset * RIGHT for i in range(len(labels))]
+        )
 
         labels.move_to(self.get_corner(DL), UL)
         labels.shift((self.tick_length + 0.05) * DOWN)
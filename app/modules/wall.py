@@ -45,25 +45,21 @@ class Wall(VGroup):
 
     def _setup_ticks(self):
         ticks_count = int(self.height / self.tick_spacing)
-        ticks = VGroup()
 
-        for i in range(ticks_count):
-            tick = Line(
-                start=np.zeros(3),
-                end=np.array([self.tick_length, self.tick_spacing / 2, 0])
-            )
-            tick.shift(np.array([
-                0,
-                i * self.tick_spacing,
-                0
-            ]))
-
-            tick.set_style(
-                stroke_width=self.stroke_width,
-                stroke_color=self.stroke_color
-            )
-
-            ticks.add(tick)
+        # Every tick is the same line, so they are drawn as
+        # instances of one template
+        tick = Line(
+            start=np.zeros(3),
+            end=np.array([self.tick_length, self.tick_spacing / 2, 0])
+        )
+        tick.set_style(
+            stroke_width=self.stroke_width,
+            stroke_color=self.stroke_color
+        )
+        ticks = InstancedVMobject(
+            tick,
+            shifts=[i * self.tick_spacing * UP for i in range(ticks_count)]
+        )
 
         ticks.move_to(self.wall, UR)
 
@@ -10,6 +10,8 @@ class SimulationScene(Scene):
         'collision_sound': 'clack_sound.wav',
         'min_time_between_sounds': 0.004,
         'scene_duration': 10,
+        # The simulation's state depends only on the time elapsed
+        'fast_forward_analytically': True,
         'simulation_config': {
             'scene_margin': {
                 'top': 1,
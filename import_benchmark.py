@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# Measures the time and memory it takes to import manimlib, each in
+# a fresh interpreter, and fails if either goes over its budget or
+# if a dependency meant to be imported lazily gets imported eagerly.
+import argparse
+import json
+import subprocess as sp
+import sys
+
+N_RUNS = 5
+# Budgets are generous relative to a typical laptop, they are
+# meant to catch an eager import of something heavy
+MODULE_TO_BUDGET = {
+    # module: (seconds, megabytes of peak resident memory)
+    "manimlib": (0.5, 80),
+    "manimlib.imports": (1.0, 150),
+}
+# Only to be imported once actually used
+LAZY_MODULES = [
+    "IPython",
+    "pyglet",
+    "moderngl_window",
+    "scipy",
+    "cv2",
+    "cairo",
+    "pydub",
+]
+
+CHILD_CODE = """
+import json
+import resource
+import sys
+import time
+
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform != "darwin":
+    # Kilobytes rather than bytes
+    max_rss *= 1024
+print(json.dumps({{
+    "time": elapsed,
+    "memory": max_rss / 2**20,
+    "modules": sorted(set(name.split(".")[0] for name in sys.modules)),
+}}))
+"""
+
+
+def measure(module):
+    output = sp.check_output([
+        sys.executable, "-c", CHILD_CODE.format(module=module)
+    ])
+    return json.loads(output)
+
+
+def check_module(module, n_runs):
+    time_budget, memory_budget = MODULE_TO_BUDGET[module]
+    results = [measure(module) for n in range(n_runs)]
+    import_time = min(result["time"] for result in results)
+    memory = min(result["memory"] for result in results)
+    eager = [name for name in LAZY_MODULES if name in results[0]["modules"]]
+    print(
+        f"{module}: {import_time:.3f}s (budget {time_budget}s), "
+        f"{memory:.0f}MB (budget {memory_budget}MB)"
+    )
+    failures = []
+    if import_time > time_budget:
+        failures.append(f"{module} took {import_time:.3f}s to import")
+    if memory > memory_budget:
+        failures.append(f"{module} used {memory:.0f}MB on import")
+    if eager:
+        failures.append(f"{module} imported {', '.join(eager)}")
+    return failures
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=N_RUNS)
+    args = parser.parse_args()
+
+    failures = []
+    for module in MODULE_TO_BUDGET:
+        failures += check_module(module, args.runs)
+    for failure in failures:
+        print("Over budget: " + failure)
+    sys.exit(1 if failures else 0)
@@ -1,14 +1,35 @@
 #!/usr/bin/env python
+import sys
+
 import manimlib.config
 import manimlib.constants
-import manimlib.extract_scene
+import manimlib.daemon
 
 
 def main():
     args = manimlib.config.parse_cli()
+    if args.daemon:
+        manimlib.daemon.serve(args.daemon_socket)
+    elif args.use_daemon:
+        sys.exit(manimlib.daemon.submit(
+            [arg for arg in sys.argv[1:] if arg != "--use_daemon"],
+            args.daemon_socket,
+        ))
+    else:
+        run(args)
+
+
+def run(args):
+    # Imported here, so that clients of the daemon stay light
+    import manimlib.extract_scene
+    import manimlib.sharding
+
     config = manimlib.config.get_configuration(args)
     manimlib.constants.initialize_directories(config)
     scenes = manimlib.extract_scene.main(config)
 
     for scene in scenes:
-        scene.run()
+        if config["n_shards"]:
+            manimlib.sharding.render_in_shards(scene, args, config)
+        else:
+            scene.run()
@@ -1,5 +1,7 @@
 from copy import deepcopy
 
+import numpy as np
+
 from manimlib.mobject.mobject import Mobject
 from manimlib.utils.config_ops import digest_config
 from manimlib.utils.rate_functions import smooth
@@ -120,8 +122,8 @@ class Animation(object):
         self.interpolate(alpha)
 
     def interpolate_mobject(self, alpha):
-        for i, mobs in enumerate(self.families):
-            sub_alpha = self.get_sub_alpha(alpha, i, len(self.families))
+        sub_alphas = self.get_sub_alphas(alpha, len(self.families))
+        for mobs, sub_alpha in zip(self.families, sub_alphas):
             self.interpolate_submobject(*mobs, sub_alpha)
 
     def interpolate_submobject(self, submobject, starting_sumobject, alpha):
@@ -138,6 +140,17 @@ class Animation(object):
         lower = index * lag_ratio
         return clip((value - lower), 0, 1)
 
+    def get_sub_alphas(self, alpha, num_submobjects):
+        """
+        Same as get_sub_alpha, computed for all
+        indices at once as an array
+        """
+        lag_ratio = self.lag_ratio
+        full_length = (num_submobjects - 1) * lag_ratio + 1
+        value = alpha * full_length
+        lowers = np.arange(num_submobjects) * lag_ratio
+        return np.clip(value - lowers, 0, 1)
+
     # Getters and setters
     def set_run_time(self, run_time):
         self.run_time = run_time
@@ -7,7 +7,7 @@ from manimlib.utils.bezier import interpolate
 from manimlib.utils.config_ops import digest_config
 from manimlib.utils.iterables import remove_list_redundancies
 from manimlib.utils.rate_functions import linear
-from manimlib.utils.simple_functions import clip
+from manimlib.utils.simple_functions import is_vectorized
 
 
 DEFAULT_LAGGED_START_LAG_RATIO = 0.05
@@ -43,6 +43,7 @@ class AnimationGroup(Animation):
     def begin(self):
         for anim in self.animations:
             anim.begin()
+        self.init_rate_func_batches()
         # self.init_run_time()
 
     def finish(self):
@@ -87,23 +88,56 @@ class AnimationGroup(Animation):
                 start_time, end_time, self.lag_ratio
             )
 
+    def init_rate_func_batches(self):
+        """
+        Sub-animations which use the default Animation.interpolate
+        and a vectorized rate function are grouped by rate function,
+        so that each frame evaluates it on all their alphas at once
+        """
+        self.start_times = np.array([awt[1] for awt in self.anims_with_timings])
+        self.anim_times = np.array([
+            awt[2] - awt[1] for awt in self.anims_with_timings
+        ])
+        batches = {}
+        self.is_batched = np.zeros(len(self.animations), dtype=bool)
+        for index, (anim, start, end) in enumerate(self.anims_with_timings):
+            rate_func = anim.get_rate_func()
+            if type(anim).interpolate is Animation.interpolate and is_vectorized(rate_func):
+                batches.setdefault(rate_func, []).append(index)
+                self.is_batched[index] = True
+        self.rate_func_batches = [
+            (rate_func, np.array(indices))
+            for rate_func, indices in batches.items()
+        ]
+
+    def get_animation_alphas(self, alpha):
+        time = alpha * self.max_end_time
+        sub_alphas = np.zeros(len(self.anim_times))
+        nonzero = self.anim_times != 0
+        sub_alphas[nonzero] = np.clip(
+            (time - self.start_times[nonzero]) / self.anim_times[nonzero],
+            0, 1
+        )
+        return sub_alphas
+
     def interpolate(self, alpha):
         # Note, if the run_time of AnimationGroup has been
         # set to something other than its default, these
         # times might not correspond to actual times,
         # e.g. of the surrounding scene.  Instead they'd
         # be a rescaled version.  But that's okay!
-        time = alpha * self.max_end_time
-        for anim, start_time, end_time in self.anims_with_timings:
-            anim_time = end_time - start_time
-            if anim_time == 0:
-                sub_alpha = 0
+        if not hasattr(self, "rate_func_batches"):
+            self.init_rate_func_batches()
+        sub_alphas = self.get_animation_alphas(alpha)
+        rate_func_values = np.zeros(len(sub_alphas))
+        for rate_func, indices in self.rate_func_batches:
+            rate_func_values[indices] = rate_func(sub_alphas[indices])
+        for index, anim in enumerate(self.animations):
+            if self.is_batched[index]:
+                # Same as anim.interpolate(sub_alphas[index])
+                anim.interpolate_mobject(rate_func_values[index])
             else:
-                sub_alpha = clip(
-                    (time - start_time) / anim_time,
-                    0, 1
-                )
-            anim.interpolate(sub_alpha)
+                anim.interpolate(sub_alphas[index])
 
 
 class Succession(AnimationGroup):
@@ -8,11 +8,14 @@ from manimlib.constants import OUT
 from manimlib.constants import DEGREES
 from manimlib.mobject.mobject import Group
 from manimlib.mobject.mobject import Mobject
+from manimlib.mobject.types.vectorized_mobject import VMobject
+from manimlib.utils.bezier import interpolate
 from manimlib.utils.config_ops import digest_config
 from manimlib.utils.paths import path_along_arc
 from manimlib.utils.paths import straight_path
 from manimlib.utils.rate_functions import smooth
 from manimlib.utils.rate_functions import squish_rate_func
+from manimlib.utils.simple_functions import vectorized
 
 
 class Transform(Animation):
@@ -50,6 +53,7 @@ class Transform(Animation):
         # of both mobject and target_mobject
         self.mobject.align_data(self.target_copy)
         super().begin()
+        self.init_family_arrays()
 
     def create_target(self):
         # Has no meaningful effect here, but may be useful
@@ -95,6 +99,86 @@ class Transform(Animation):
             ]
         ])
 
+    def can_interpolate_families_at_once(self):
+        if len(self.families) == 0:
+            return False
+        if type(self).interpolate_submobject is not Transform.interpolate_submobject:
+            return False
+        if self.lag_ratio != 0 and self.path_func is not straight_path:
+            return False
+        # Start and target arrays are only read once, in
+        # init_family_arrays, so they must not change
+        mobs_to_check = [self.starting_mobject, self.target_copy]
+        if not self.suspend_mobject_updating:
+            mobs_to_check.append(self.mobject)
+        if any(mob.get_family_updaters() for mob in mobs_to_check):
+            return False
+        return all([
+            isinstance(submob, VMobject) and
+            type(submob).interpolate is Mobject.interpolate and
+            type(submob).interpolate_color is VMobject.interpolate_color
+            for submob, start, target in self.families
+        ])
+
+    def init_family_arrays(self):
+        """
+        When possible, the points and color arrays of all submobjects,
+        their starting states and their targets are stacked into single
+        arrays.  Each submobject's arrays are then replaced with views
+        into the stacked live arrays, so that interpolate_mobject can
+        update every submobject with a few array operations.
+        """
+        self.family_arrays = {}
+        if not self.can_interpolate_families_at_once():
+            return
+
+        submobs = [mobs[0] for mobs in self.families]
+        attrs = ["points", *submobs[0].get_color_array_attrs()]
+        for attr in attrs:
+            live_arrays = [np.array(getattr(sm, attr)) for sm in submobs]
+            if any(arr.ndim == 0 for arr in live_arrays):
+                self.family_arrays = {}
+                return
+            start_arrays, target_arrays = [
+                [
+                    np.broadcast_to(getattr(mobs[i], attr), arr.shape)
+                    for mobs, arr in zip(self.families, live_arrays)
+                ]
+                for i in (1, 2)
+            ]
+            lengths = [len(arr) for arr in live_arrays]
+            live = self.stack_arrays(live_arrays)
+            ends = np.cumsum(lengths)
+            for sm, arr, end, length in zip(submobs, live_arrays, ends, lengths):
+                setattr(sm, attr, live[end - length:end].reshape(arr.shape))
+            self.family_arrays[attr] = (
+                self.stack_arrays(start_arrays),
+                self.stack_arrays(target_arrays),
+                live,
+                np.repeat(np.arange(len(submobs)), lengths),
+            )
+
+    def stack_arrays(self, arrays):
+        return np.vstack([
+            np.reshape(arr, (len(arr), -1))
+            for arr in arrays
+        ])
+
+    def interpolate_mobject(self, alpha):
+        if not getattr(self, "family_arrays", None):
+            return super().interpolate_mobject(alpha)
+
+        sub_alphas = self.get_sub_alphas(alpha, len(self.families))
+        for attr, (start, target, live, owners) in self.family_arrays.items():
+            if self.lag_ratio == 0:
+                alphas = sub_alphas[0]
+            else:
+                alphas = sub_alphas[owners][:, np.newaxis]
+            if attr == "points":
+                live[:] = self.path_func(start, target, alphas)
+            else:
+                live[:] = interpolate(start, target, alphas)
+
     def interpolate_submobject(self, submob, start, target_copy, alpha):
         submob.interpolate(
             start, target_copy,
@@ -240,6 +324,7 @@ class ApplyMatrix(ApplyPointwiseFunction):
     def __init__(self, matrix, mobject, **kwargs):
         matrix = self.initialize_matrix(matrix)
 
+        @vectorized
         def func(p):
             return np.dot(p, matrix.T)
 
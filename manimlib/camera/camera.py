@@ -1,5 +1,6 @@
-from functools import reduce
-import operator as op
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import threading
 import moderngl
 from colour import Color
 
@@ -12,11 +13,55 @@ from manimlib.mobject.mobject import Mobject
 from manimlib.utils.config_ops import digest_config
 from manimlib.utils.iterables import batch_by_property
 from manimlib.utils.simple_functions import fdiv
-from manimlib.utils.shaders import shader_info_to_id
-from manimlib.utils.shaders import shader_id_to_info
+from manimlib.utils.stroke_tessellation import tessellate_stroke_data
+from manimlib.utils.stroke_tessellation import apply_instances_to_stroke_data
+from manimlib.utils.shaders import shader_info_to_batch_key
+from manimlib.utils.shaders import get_shader_descriptor
 from manimlib.utils.shaders import get_shader_code_from_file
 
 
+STANDALONE_CONTEXT = None
+
+# Strokes drawn with this geometry shader can instead be
+# tessellated on the cpu, see Camera.tessellate_strokes
+STROKE_GEOM_SHADER_FILE = "quadratic_bezier_stroke_geom.glsl"
+TESSELLATED_STROKE_VERT_SHADER_FILE = "quadratic_bezier_stroke_tessellated_vert.glsl"
+
+# Shaders for the cover pass of fills drawn by Camera.render_stencil_fill
+FILL_COVER_VERT_SHADER_FILE = "quadratic_bezier_fill_cover_vert.glsl"
+FILL_COVER_FRAG_SHADER_FILE = "quadratic_bezier_fill_cover_frag.glsl"
+
+# Texture units from N_IMAGE_TEXTURE_UNITS on are kept for the
+# camera's own passes, with those below shared by image textures
+N_IMAGE_TEXTURE_UNITS = 14
+WINDING_TEXTURE_UNIT = 14
+YUV420_TEXTURE_UNIT = 15
+
+BLEND_FUNC = (
+    moderngl.SRC_ALPHA, moderngl.ONE_MINUS_SRC_ALPHA,
+    moderngl.ONE, moderngl.ONE
+)
+
+
+def get_standalone_context():
+    # Cameras rendering without a window all share one context,
+    # so that each scene in a run doesn't start from scratch
+    global STANDALONE_CONTEXT
+    if STANDALONE_CONTEXT is None:
+        STANDALONE_CONTEXT = moderngl.create_standalone_context()
+    return STANDALONE_CONTEXT
+
+
+def release_standalone_programs():
+    # Programs linked on the shared context, see Camera.get_program,
+    # to be called once no camera is using them
+    ctx = STANDALONE_CONTEXT
+    if ctx is None or ctx.extra is None:
+        return
+    for program in ctx.extra.pop("manim_programs", {}).values():
+        program.release()
+
+
 # TODO, think about how to incorporate perspective,
 # and change get_height, etc. to take orientation into account
 class CameraFrame(Mobject):
@@ -56,6 +101,26 @@ class Camera(object):
         "n_channels": 4,
         "pixel_array_dtype": 'uint8',
         "line_width_multiple": 0.01,
+        # Leading mobjects whose shader data the scene has locked
+        # are rendered once into background_fbo, which is then
+        # copied in under everything else
+        "use_background_layer": True,
+        # Skip generating shader data for mobjects whose points lie
+        # entirely outside the frame, padded by culling_buff
+        "cull_offscreen_mobjects": True,
+        "culling_buff": 0.25,
+        # Expand strokes into triangles with numpy, rather than with
+        # a geometry shader, which is faster on software contexts
+        "tessellate_strokes_on_cpu": False,
+        # Fills using stencil-then-cover are resolved from this
+        # many samples along each axis of a pixel
+        "stencil_fill_supersampling": 2,
+        # With more than one thread, shader data for chunks of the
+        # mobjects passed to capture is built on a thread pool, as
+        # is the packing of that data into batches.  A mobject should
+        # then not be in the family of more than one of them.
+        "n_packing_threads": 1,
+        "packing_chunks_per_thread": 4,
     }
 
     def __init__(self, ctx=None, **kwargs):
@@ -65,6 +130,8 @@ class Camera(object):
         self.init_context(ctx)
         self.init_shaders()
         self.init_textures()
+        self.init_frame_state()
+        self.init_packing()
 
     def init_frame(self):
         self.frame = CameraFrame(**self.frame_config)
@@ -73,17 +140,50 @@ class Camera(object):
         if ctx is not None:
             self.ctx = ctx
             self.fbo = self.ctx.detect_framebuffer()
+            self.draws_to_window = True
         else:
-            self.ctx = moderngl.create_standalone_context()
+            self.ctx = get_standalone_context()
             self.fbo = self.get_fbo()
             self.fbo.use()
+            self.draws_to_window = False
 
         self.ctx.enable(moderngl.BLEND)
-        self.ctx.blend_func = (
-            moderngl.SRC_ALPHA, moderngl.ONE_MINUS_SRC_ALPHA,
-            moderngl.ONE, moderngl.ONE
-        )
+        self.ctx.blend_func = BLEND_FUNC
+        self.background_fbo = None
+        self.winding_fbo = None
+        self.yuv420_fbo = None
+
+    def release(self):
+        """
+        Frees everything this camera made on the context, which
+        may go on to serve other scenes, e.g. those of a daemon
+        """
+        if not self.draws_to_window:
+            self.fbo.release()
+        if self.background_fbo is not None:
+            self.background_fbo.release()
+        if self.winding_fbo is not None:
+            self.winding_fbo.release()
+            self.winding_texture.release()
+        if self.yuv420_fbo is not None:
+            self.release_yuv420_targets()
+            self.yuv420_vao.release()
+            self.yuv420_vbo.release()
+            del self.yuv420_vao
         self.background_fbo = None
+        self.winding_fbo = None
+        self.yuv420_fbo = None
+        for objects in self.id_to_vertex_array.values():
+            # All but the dtypes at the end
+            for obj in objects[:-1]:
+                obj.release()
+        for texture in self.texture_id_to_texture.values():
+            texture.release()
+        self.init_shaders()
+        self.init_textures()
+        if self.packing_pool is not None:
+            self.packing_pool.shutdown()
+            self.packing_pool = None
 
     # Methods associated with the frame buffer
     def get_fbo(self):
@@ -111,8 +211,17 @@ class Camera(object):
         self.set_frame_width(frame_width)
 
     def clear(self):
+        # Left to the next capture, which may find the frame
+        # unchanged and keep what's already in the fbo
+        self.clear_pending = True
+
+    def apply_pending_clear(self):
+        if not self.clear_pending:
+            return
         rgba = (*Color(self.background_color).get_rgb(), self.background_opacity)
         self.fbo.clear(*rgba)
+        self.clear_pending = False
+        self.last_frame_state = None
 
     def reset_pixel_shape(self, new_width, new_height):
         self.pixel_width = new_width
@@ -121,12 +230,24 @@ class Camera(object):
 
     # Various ways to read from the fbo
     def get_raw_fbo_data(self, dtype='f1'):
+        self.apply_pending_clear()
         return self.fbo.read(
             viewport=self.fbo.viewport,
             components=self.n_channels,
             dtype=dtype,
         )
 
+    def read_raw_fbo_data_into(self, buffer, dtype='f1'):
+        # Like get_raw_fbo_data, but without allocating, e.g.
+        # to read straight into a memory mapped file
+        self.apply_pending_clear()
+        self.fbo.read_into(
+            buffer,
+            viewport=self.fbo.viewport,
+            components=self.n_channels,
+            dtype=dtype,
+        )
+
     def get_image(self, pixel_array=None):
         return Image.frombytes(
             'RGBA',
@@ -152,6 +273,58 @@ class Camera(object):
         )
         return texture
 
+    def get_raw_yuv420_data(self):
+        """
+        Returns the frame as planar yuv420 bytes, top row first, with
+        the conversion done on the gpu.  Pixel width and height must
+        both be even.
+        """
+        pw, ph = self.get_pixel_shape()
+        if self.yuv420_fbo is None or self.yuv420_fbo.size != (pw, 3 * ph // 2):
+            self.init_yuv420_pass(pw, ph)
+        self.apply_pending_clear()
+        self.ctx.copy_framebuffer(self.yuv420_source_fbo, self.fbo)
+        self.yuv420_source_texture.use(location=YUV420_TEXTURE_UNIT)
+        # The program may be shared with cameras of other sizes
+        self.yuv420_vao.program["pixel_shape"].value = (pw, ph)
+        self.yuv420_fbo.use()
+        self.ctx.disable(moderngl.BLEND)
+        self.yuv420_vao.render(moderngl.TRIANGLE_STRIP)
+        self.ctx.enable(moderngl.BLEND)
+        self.fbo.use()
+        return self.yuv420_fbo.read(components=1)
+
+    def init_yuv420_pass(self, pw, ph):
+        if self.yuv420_fbo is not None:
+            self.release_yuv420_targets()
+        self.yuv420_source_texture = self.ctx.texture((pw, ph), 4)
+        self.yuv420_source_fbo = self.ctx.framebuffer(
+            color_attachments=[self.yuv420_source_texture]
+        )
+        # One byte per fragment, with the Y plane followed
+        # by the quarter sized U and V planes
+        self.yuv420_texture = self.ctx.texture((pw, 3 * ph // 2), 1)
+        self.yuv420_fbo = self.ctx.framebuffer(
+            color_attachments=[self.yuv420_texture]
+        )
+        if not hasattr(self, "yuv420_vao"):
+            program = self.get_program(
+                vertex_shader=get_shader_code_from_file("rgba_to_yuv420_vert.glsl"),
+                fragment_shader=get_shader_code_from_file("rgba_to_yuv420_frag.glsl"),
+            )
+            program["Texture"].value = YUV420_TEXTURE_UNIT
+            self.yuv420_vbo = self.ctx.buffer(np.array([
+                [-1, -1], [1, -1], [-1, 1], [1, 1]
+            ], dtype='f4').tobytes())
+            self.yuv420_vao = self.ctx.simple_vertex_array(program, self.yuv420_vbo, "point")
+
+    def release_yuv420_targets(self):
+        for obj in [
+            self.yuv420_source_fbo, self.yuv420_source_texture,
+            self.yuv420_fbo, self.yuv420_texture,
+        ]:
+            obj.release()
+
     # Getting camera attributes
     def get_pixel_shape(self):
         return self.fbo.viewport[2:4]
@@ -196,72 +369,526 @@ class Camera(object):
             scale = fh / ph
             return fc + scale * np.array([(px - pw / 2), (py - ph / 2), 0])
 
-    # TODO, account for 3d
-    # Also, move this to CameraFrame?
-    def is_in_frame(self, mobject):
+    def get_visible_bounds(self):
+        # Lower left and upper right corners of the visible region
         fc = self.get_frame_center()
         fh = self.get_frame_height()
-        fw = self.get_frame_width()
-        return not reduce(op.or_, [
-            mobject.get_right()[0] < fc[0] - fw,
-            mobject.get_bottom()[1] > fc[1] + fh,
-            mobject.get_left()[0] > fc[0] + fw,
-            mobject.get_top()[1] < fc[1] - fh,
-        ])
+        pw, ph = self.get_pixel_shape()
+        fw = fh * pw / ph
+        return (
+            fc[:2] - np.array([fw, fh]) / 2,
+            fc[:2] + np.array([fw, fh]) / 2,
+        )
+
+    # TODO, account for 3d
+    def is_in_frame(self, mobject, visible_bounds=None):
+        # Only considers the points of mobject itself, not those
+        # of its submobjects, padded to allow for stroke width
+        points = mobject.get_own_points_defining_boundary()
+        if len(points) == 0:
+            return True
+        if visible_bounds is None:
+            visible_bounds = self.get_visible_bounds()
+        lower_left, upper_right = visible_bounds
+        buff = self.culling_buff
+        if hasattr(mobject, "stroke_width"):
+            buff += self.line_width_multiple * np.max(mobject.stroke_width)
+        mins = points[:, :2].min(0)
+        maxs = points[:, :2].max(0)
+        return bool((maxs >= lower_left - buff).all() and (mins <= upper_right + buff).all())
+
+    def should_cull(self, mobject):
+        if self.is_in_frame(mobject, self.visible_bounds):
+            return False
+        with self.packing_lock:
+            self.n_culled_mobjects += 1
+        return True
 
     # Rendering
     def capture(self, *mobjects, **kwargs):
-        self.refresh_shader_uniforms()
+        frame_state = self.get_frame_state(mobjects)
+        unchanged = self.frame_state_matches(frame_state)
+        if unchanged and self.clear_pending and not self.draws_to_window:
+            # What the last capture rendered is still in the fbo
+            self.clear_pending = False
+            return
+        if not unchanged:
+            self.state_version += 1
 
-        shader_infos = it.chain(*[
-            mob.get_shader_info_list()
-            for mob in mobjects
-        ])
-        batches = batch_by_property(shader_infos, shader_info_to_id)
+        # The context may be shared with other cameras
+        self.fbo.use()
+        self.apply_pending_clear()
+        self.last_frame_state = frame_state
+        self.refresh_shader_uniforms()
 
-        for info_group, sid in batches:
-            if len(info_group) == 1:
-                data = info_group[0]["data"]
-            else:
-                data = np.hstack([info["data"] for info in info_group])
+        # Number of family members left out of this
+        # capture for being off screen
+        self.n_culled_mobjects = 0
+        self.visible_bounds = self.get_visible_bounds()
+        cull_func = self.should_cull if self.cull_offscreen_mobjects else None
+        if self.use_background_layer:
+            n_static = self.get_num_leading_locked_mobjects(mobjects)
+        else:
+            n_static = 0
+        if n_static > 0:
+            self.composite_background_layer(mobjects[:n_static])
+        shader_infos = self.get_shader_infos(mobjects[n_static:], cull_func)
+        self.render_shader_infos(shader_infos)
+
+    # Building shader data, possibly on several threads
+    def init_packing(self):
+        self.packing_lock = threading.Lock()
+        self.packing_pool = None
+        if self.n_packing_threads > 1:
+            self.packing_pool = ThreadPoolExecutor(
+                max_workers=self.n_packing_threads,
+                thread_name_prefix="shader_packing",
+            )
 
-            shader = self.get_shader(info_group[0])
-            render_primative = int(info_group[0]["render_primative"])
-            self.render(shader, data, render_primative)
+    def get_chunks(self, items):
+        # Contiguous runs of items, so that order is kept
+        n_chunks = min(len(items), self.n_packing_threads * self.packing_chunks_per_thread)
+        bounds = np.linspace(0, len(items), n_chunks + 1).astype(int)
+        return [items[i1:i2] for i1, i2 in zip(bounds, bounds[1:])]
+
+    def get_shader_infos(self, mobjects, cull_func=None):
+        def get_chunk_infos(chunk):
+            return [
+                info
+                for mob in chunk
+                for info in mob.get_shader_info_list(cull_func)
+            ]
+
+        if self.packing_pool is None or len(mobjects) < 2:
+            return get_chunk_infos(mobjects)
+        # Results come back in the order of the chunks
+        chunk_infos = self.packing_pool.map(get_chunk_infos, self.get_chunks(mobjects))
+        return list(it.chain(*chunk_infos))
+
+    def render_shader_infos(self, shader_infos):
+        batches = batch_by_property(shader_infos, shader_info_to_batch_key)
+        batch_data = self.gather_batch_data([info_group for info_group, key in batches])
+
+        # Stencil fills in a row are gathered, so that
+        # render_stencil_fills can draw them together
+        stencil_fills = []
+        for (info_group, key), data in zip(batches, batch_data):
+            descriptor = info_group[0].descriptor
+            if info_group[0].fill_rgba is not None:
+                stencil_fills.append((info_group[0], data))
+                continue
+            self.render_stencil_fills(stencil_fills)
+            stencil_fills = []
+            instance_data = info_group[0].instance_data
+            if self.tessellate_strokes_on_cpu and self.is_stroke_shader(descriptor):
+                descriptor, data = self.tessellate_strokes(descriptor, data, instance_data)
+                instance_data = None
+            shader = self.get_shader(descriptor)
+            self.render(descriptor.id, shader, data, descriptor.render_primative, instance_data)
+        self.render_stencil_fills(stencil_fills)
+
+    def is_stroke_shader(self, descriptor):
+        return descriptor.geom == STROKE_GEOM_SHADER_FILE
+
+    def tessellate_strokes(self, descriptor, data, instance_data=None):
+        # Returns the descriptor of a shader drawing plain triangles,
+        # along with the tessellated data which it should be given
+        if instance_data is not None:
+            data = apply_instances_to_stroke_data(data, instance_data)
+        tessellated_descriptor = get_shader_descriptor(
+            vert_file=TESSELLATED_STROKE_VERT_SHADER_FILE,
+            frag_file=descriptor.frag,
+            texture_path=descriptor.texture_path,
+            render_primative=moderngl.TRIANGLES,
+        )
+        anti_alias_width = ANTI_ALIAS_WIDTH_OVER_FRAME_HEIGHT * self.get_frame_height()
+        return tessellated_descriptor, tessellate_stroke_data(data, anti_alias_width)
 
-    def render(self, shader, data, render_primative):
+    def render_stencil_fills(self, fills):
+        """
+        Fills paths by adding up the signed coverage of their triangles
+        into the winding texture, at a higher resolution than the frame,
+        then covering their bounding boxes with their rgbas wherever the
+        winding number is nonzero.  Paths in a row whose boxes don't
+        overlap share these two passes, each in its own part of the
+        texture, which only spans the boxes of those paths.  Any path
+        too big for a texture on this context is triangulated instead.
+        """
+        ss = self.stencil_fill_supersampling
+        max_size = self.ctx.info["GL_MAX_TEXTURE_SIZE"] // ss
+        group = []
+        # Boxes of the group, and their union
+        boxes = np.zeros((len(fills), 4), dtype=int)
+        union = None
+        for info, data in fills:
+            if len(data) == 0 or info.fill_rgba[3] == 0:
+                continue
+            box = self.get_pixel_box(data["point"])
+            if box is None:
+                continue
+            if max(box[2] - box[0], box[3] - box[1]) > max_size:
+                self.render_stencil_fill_group(group)
+                group = []
+                fallback = info.fill_fallback()
+                shader = self.get_shader(fallback.descriptor)
+                self.render(
+                    fallback.descriptor.id, shader, fallback.data,
+                    fallback.descriptor.render_primative
+                )
+                continue
+            if group:
+                group_boxes = boxes[:len(group)]
+                new_union = (
+                    min(union[0], box[0]), min(union[1], box[1]),
+                    max(union[2], box[2]), max(union[3], box[3]),
+                )
+                if any([
+                    info.descriptor is not group[0][0].descriptor,
+                    max(new_union[2] - new_union[0], new_union[3] - new_union[1]) > max_size,
+                    np.any(
+                        (group_boxes[:, 0] < box[2]) & (box[0] < group_boxes[:, 2]) &
+                        (group_boxes[:, 1] < box[3]) & (box[1] < group_boxes[:, 3])
+                    ),
+                ]):
+                    self.render_stencil_fill_group(group)
+                    group = []
+            union = new_union if group else box
+            boxes[len(group)] = box
+            group.append((info, data, box))
+        self.render_stencil_fill_group(group)
+
+    def get_pixel_box(self, points):
+        # Pixels around points, padded by a pixel, as (x0, y0, x1, y1),
+        # or None if they're all outside the frame
+        pw, ph = self.get_pixel_shape()
+        pixels_per_unit = ph / self.get_frame_height()
+        offset = np.array([pw, ph]) / 2 - self.get_frame_center()[:2] * pixels_per_unit
+        x0, y0 = np.clip(np.floor(points[:, :2].min(0) * pixels_per_unit + offset - 1), 0, (pw, ph)).astype(int)
+        x1, y1 = np.clip(np.ceil(points[:, :2].max(0) * pixels_per_unit + offset + 1), 0, (pw, ph)).astype(int)
+        if x1 <= x0 or y1 <= y0:
+            return None
+        return (x0, y0, x1, y1)
+
+    def render_stencil_fill_group(self, group):
+        if not group:
+            return
+        ss = self.stencil_fill_supersampling
+        target_fbo = self.ctx.fbo
+        pw, ph = self.get_pixel_shape()
+        boxes = np.array([box for info, data, box in group])
+        x0, y0 = boxes[:, :2].min(0)
+        x1, y1 = boxes[:, 2:].max(0)
+        width, height = ss * (x1 - x0), ss * (y1 - y0)
+        self.init_winding_fbo(width, height)
+
+        self.winding_fbo.viewport = (0, 0, width, height)
+        # Clearing each box is much quicker than clearing all
+        # the space between them, at least on llvmpipe
+        for bx0, by0, bx1, by1 in boxes:
+            self.winding_fbo.clear(viewport=(
+                ss * (bx0 - x0), ss * (by0 - y0),
+                ss * (bx1 - bx0), ss * (by1 - by0),
+            ))
+        self.winding_fbo.use()
+        self.ctx.blend_func = (moderngl.ONE, moderngl.ONE)
+        descriptor = group[0][0].descriptor
+        shader = self.get_shader(descriptor)
+        shader["winding_box"].value = (
+            2 * x0 / pw - 1, 2 * y0 / ph - 1,
+            2 * x1 / pw - 1, 2 * y1 / ph - 1,
+        )
+        data = np.concatenate([data for info, data, box in group])
+        self.render(descriptor.id, shader, data, moderngl.TRIANGLES)
+        self.ctx.blend_func = BLEND_FUNC
+        target_fbo.use()
+
+        cover_descriptor = get_shader_descriptor(
+            vert_file=FILL_COVER_VERT_SHADER_FILE,
+            frag_file=FILL_COVER_FRAG_SHADER_FILE,
+            render_primative=moderngl.TRIANGLES,
+        )
+        cover_shader = self.get_shader(cover_descriptor)
+        self.winding_texture.use(location=WINDING_TEXTURE_UNIT)
+        cover_shader["Winding"].value = WINDING_TEXTURE_UNIT
+        cover_shader["supersampling"].value = ss
+        cover_shader["winding_origin"].value = (
+            target_fbo.viewport[0] + x0,
+            target_fbo.viewport[1] + y0,
+        )
+        # Two triangles covering each box
+        quads = np.zeros(6 * len(group), dtype=[
+            ("point", np.float32, (3,)),
+            ("color", np.float32, (4,)),
+        ])
+        corners = boxes[:, [0, 1, 2, 1, 0, 3, 2, 1, 2, 3, 0, 3]].reshape((-1, 2))
+        pixels_per_unit = ph / self.get_frame_height()
+        quads["point"][:, :2] = (corners - np.array([pw, ph]) / 2) / pixels_per_unit
+        quads["point"] += self.get_frame_center()
+        quads["color"] = np.repeat([info.fill_rgba for info, data, box in group], 6, axis=0)
+        self.render(cover_descriptor.id, cover_shader, quads, moderngl.TRIANGLES)
+
+    def init_winding_fbo(self, width, height):
+        # Grows to fit the largest group of paths drawn so far
+        if self.winding_fbo is not None:
+            curr_width, curr_height = self.winding_texture.size
+            if curr_width >= width and curr_height >= height:
+                return
+            width = max(width, curr_width)
+            height = max(height, curr_height)
+            self.winding_fbo.release()
+            self.winding_texture.release()
+        self.winding_texture = self.ctx.texture((width, height), 1, dtype="f2")
+        self.winding_fbo = self.ctx.framebuffer(color_attachments=[self.winding_texture])
+
+    def gather_batch_data(self, info_groups):
+        """
+        Returns the data to draw for each group of shader infos.  Groups
+        with more than one are copied into disjoint regions of an arena
+        per dtype, reused from frame to frame, rather than allocating
+        with np.hstack.
+        """
+        result = [None] * len(info_groups)
+        regions = []
+        dtype_to_size = {}
+        for index, info_group in enumerate(info_groups):
+            if len(info_group) == 1:
+                result[index] = info_group[0].data
+                continue
+            arrays = [info.data for info in info_group]
+            dtype = arrays[0].dtype
+            start = dtype_to_size.get(dtype, 0)
+            size = sum(len(arr) for arr in arrays)
+            dtype_to_size[dtype] = start + size
+            regions.append((index, dtype, start, arrays))
+
+        arenas = {
+            dtype: self.get_data_arena(dtype, size)
+            for dtype, size in dtype_to_size.items()
+        }
+        copies = []
+        for index, dtype, start, arrays in regions:
+            offset = start
+            for arr in arrays:
+                copies.append((arenas[dtype], offset, arr))
+                offset += len(arr)
+            result[index] = arenas[dtype][start:offset]
+
+        def copy_chunk(chunk):
+            for arena, offset, arr in chunk:
+                arena[offset:offset + len(arr)] = arr
+
+        if self.packing_pool is None or len(copies) < 2:
+            copy_chunk(copies)
+        else:
+            list(self.packing_pool.map(copy_chunk, self.get_chunks(copies)))
+        return result
+
+    def get_data_arena(self, dtype, size):
+        arena = self.dtype_to_arena.get(dtype)
+        if arena is None or len(arena) < size:
+            min_size = 0 if arena is None else 2 * len(arena)
+            arena = np.empty(max(size, min_size), dtype=dtype)
+            self.dtype_to_arena[dtype] = arena
+        return arena
+
+    def render(self, sid, shader, data, render_primative, instance_data=None):
         if data is None or len(data) == 0:
             return
         if shader is None:
             return
-        vbo = self.ctx.buffer(data.tobytes())
-        vao = self.ctx.simple_vertex_array(shader, vbo, *data.dtype.names)
-        vao.render(render_primative)
+        self.bind_texture(sid, shader)
+        if instance_data is None:
+            vbo, vao = self.get_vertex_array(sid, shader, data)
+            self.write_to_buffer(vbo, data)
+            vao.render(render_primative, vertices=len(data))
+            return
+        if len(instance_data) == 0:
+            return
+        vbo, ibo, vao = self.get_instanced_vertex_array(sid, shader, data, instance_data)
+        self.write_to_buffer(vbo, data)
+        self.write_to_buffer(ibo, instance_data)
+        vao.render(
+            render_primative,
+            vertices=len(data),
+            instances=len(instance_data),
+        )
+
+    def write_to_buffer(self, buff, data):
+        buff.orphan()
+        buff.write(np.ascontiguousarray(data))
+
+    def get_vertex_array(self, sid, shader, data):
+        # Each shader id keeps a buffer and vertex array, which
+        # are only replaced when the data outgrows the buffer
+        vbo, vao, dtype = self.id_to_vertex_array.get(sid, (None, None, None))
+        if vbo is None or vbo.size < data.nbytes or dtype != data.dtype:
+            reserve = max(data.nbytes, 0 if vbo is None else 2 * vbo.size)
+            if vbo is not None:
+                vao.release()
+                vbo.release()
+            vbo = self.ctx.buffer(reserve=reserve)
+            vao = self.ctx.simple_vertex_array(shader, vbo, *data.dtype.names)
+            self.id_to_vertex_array[sid] = (vbo, vao, data.dtype)
+        return vbo, vao
+
+    def get_instanced_vertex_array(self, sid, shader, data, instance_data):
+        # As with get_vertex_array, but with a second buffer
+        # holding attributes which advance once per instance
+        key = (sid, "instanced")
+        vbo, ibo, vao, dtypes = self.id_to_vertex_array.get(key, (None, None, None, None))
+        if any([
+            vbo is None,
+            dtypes != (data.dtype, instance_data.dtype),
+            vbo is not None and vbo.size < data.nbytes,
+            ibo is not None and ibo.size < instance_data.nbytes,
+        ]):
+            reserves = [
+                max(arr.nbytes, 0 if buff is None else 2 * buff.size)
+                for arr, buff in [(data, vbo), (instance_data, ibo)]
+            ]
+            if vbo is not None:
+                vao.release()
+                vbo.release()
+                ibo.release()
+            vbo = self.ctx.buffer(reserve=reserves[0])
+            ibo = self.ctx.buffer(reserve=reserves[1])
+            names = data.dtype.names
+            inames = instance_data.dtype.names
+            vao = self.ctx.vertex_array(shader, [
+                (vbo, moderngl.detect_format(shader, names), *names),
+                (ibo, moderngl.detect_format(shader, inames) + "/i", *inames),
+            ])
+            self.id_to_vertex_array[key] = (vbo, ibo, vao, (data.dtype, instance_data.dtype))
+        return vbo, ibo, vao
+
+    # Tracking changes between frames
+    def init_frame_state(self):
+        # Incremented whenever a capture may produce
+        # different pixels from the one before it
+        self.state_version = 0
+        self.clear_pending = True
+        self.last_frame_state = None
+        self.background_layer_key = None
+        self.background_layer_states = []
+
+    def get_frame_key(self):
+        return (
+            self.frame.points.tobytes(),
+            tuple(self.fbo.viewport),
+            self.get_pixel_shape(),
+            self.background_color,
+            self.background_opacity,
+        )
+
+    def get_frame_state(self, mobjects):
+        return (self.get_frame_key(), self.get_lock_states(mobjects))
+
+    def frame_state_matches(self, frame_state):
+        # A capture of the same locked mobjects, through an
+        # unchanged frame, renders the same pixels as before
+        if self.last_frame_state is None:
+            return False
+        key, states = frame_state
+        last_key, last_states = self.last_frame_state
+        return key == last_key and self.lock_states_match(states, last_states)
+
+    def get_num_leading_locked_mobjects(self, mobjects):
+        # The scene locks the shader data of mobjects which stay still
+        # through an animation, so that until they're unlocked, they
+        # draw the same thing from one frame to the next
+        count = 0
+        for mob in mobjects:
+            if not mob.shader_data_is_locked:
+                break
+            count += 1
+        return count
+
+    def get_lock_states(self, mobjects):
+        return [
+            (mob, mob.saved_shader_info_list if mob.shader_data_is_locked else None)
+            for mob in mobjects
+        ]
+
+    def lock_states_match(self, states1, states2):
+        # Whether two lists of lock states are those of the same
+        # mobjects, each locked with the same saved shader data
+        return len(states1) == len(states2) and all(
+            mob1 is mob2 and saved1 is not None and saved1 is saved2
+            for (mob1, saved1), (mob2, saved2) in zip(states1, states2)
+        )
+
+    def composite_background_layer(self, mobjects):
+        """
+        Copies in the background layer, holding the given locked
+        mobjects, rendering it anew when they or the frame have
+        changed since it was last rendered
+        """
+        key = self.get_frame_key()
+        states = self.get_lock_states(mobjects)
+        if key != self.background_layer_key or not self.lock_states_match(
+            states, self.background_layer_states
+        ):
+            self.render_background_layer(self.get_shader_infos(mobjects))
+            self.background_layer_key = key
+            self.background_layer_states = states
+        self.ctx.copy_framebuffer(self.fbo, self.background_fbo)
+
+    def render_background_layer(self, shader_infos):
+        if self.background_fbo is None or self.background_fbo.size != self.fbo.size:
+            if self.background_fbo is not None:
+                self.background_fbo.release()
+            self.background_fbo = self.ctx.simple_framebuffer(self.fbo.size)
+        self.background_fbo.use()
+        rgba = (*Color(self.background_color).get_rgb(), self.background_opacity)
+        self.background_fbo.clear(*rgba)
+        self.render_shader_infos(shader_infos)
+        self.fbo.use()
 
     # Shaders
     def init_shaders(self):
-        # Initialize with the null id going to None
-        self.id_to_shader = {"": None}
+        self.id_to_shader = {}
+        self.id_to_vertex_array = {}
+        self.dtype_to_arena = {}
 
-    def get_shader(self, shader_info):
-        sid = shader_info_to_id(shader_info)
+    def get_shader(self, descriptor):
+        sid = descriptor.id
         if sid not in self.id_to_shader:
-            info = shader_id_to_info(sid)
-            shader = self.ctx.program(
-                vertex_shader=get_shader_code_from_file(info["vert"]),
-                geometry_shader=get_shader_code_from_file(info["geom"]),
-                fragment_shader=get_shader_code_from_file(info["frag"]),
+            if not (descriptor.vert and descriptor.frag):
+                self.id_to_shader[sid] = None
+                return None
+            shader = self.get_program(
+                vertex_shader=get_shader_code_from_file(descriptor.vert),
+                geometry_shader=get_shader_code_from_file(descriptor.geom),
+                fragment_shader=get_shader_code_from_file(descriptor.frag),
             )
-            if info["texture_path"]:
-                # TODO, this currently assumes that the uniform Sampler2D
-                # is named Texture
-                tid = self.get_texture_id(info["texture_path"])
-                shader["Texture"].value = tid
+            if descriptor.texture_path:
+                tid = self.get_texture_id(descriptor.texture_path)
+                # Past N_IMAGE_TEXTURE_UNITS textures, units are shared,
+                # see bind_texture
+                unit = tid % N_IMAGE_TEXTURE_UNITS
+                self.id_to_texture[sid] = (self.texture_id_to_texture[tid], unit)
 
             self.set_shader_uniforms(shader)
             self.id_to_shader[sid] = shader
         return self.id_to_shader[sid]
 
+    def get_program(self, vertex_shader, fragment_shader, geometry_shader=None):
+        # Linked programs are kept on the context, keyed by a hash of their
+        # source, so that cameras sharing a context don't recompile them
+        if self.ctx.extra is None:
+            self.ctx.extra = {}
+        programs = self.ctx.extra.setdefault("manim_programs", {})
+        key = hashlib.sha256("\0".join([
+            vertex_shader or "", geometry_shader or "", fragment_shader or "",
+        ]).encode()).hexdigest()
+        if key not in programs:
+            programs[key] = self.ctx.program(
+                vertex_shader=vertex_shader,
+                geometry_shader=geometry_shader,
+                fragment_shader=fragment_shader,
+            )
+        return programs[key]
+
     def set_shader_uniforms(self, shader):
         if shader is None:
             return
@@ -288,6 +915,20 @@ class Camera(object):
 
     def init_textures(self):
         self.path_to_texture_id = {}
+        self.texture_id_to_texture = {}
+        self.id_to_texture = {}
+
+    def bind_texture(self, sid, shader):
+        # Programs are shared between shader ids differing only in
+        # their texture, and textures between cameras sharing the
+        # context, so both are set again before each render
+        if sid not in self.id_to_texture:
+            return
+        texture, unit = self.id_to_texture[sid]
+        texture.use(location=unit)
+        # TODO, this currently assumes that the uniform Sampler2D
+        # is named Texture
+        shader["Texture"].value = unit
 
     def get_texture_id(self, path):
         if path not in self.path_to_texture_id:
@@ -299,6 +940,6 @@ class Camera(object):
                 components=len(im.getbands()),
                 data=im.tobytes(),
             )
-            texture.use(location=tid)
             self.path_to_texture_id[path] = tid
+            self.texture_id_to_texture[tid] = texture
         return self.path_to_texture_id[path]
@@ -45,6 +45,14 @@ class ThreeDCamera(Camera):
         self.reset_rotation_matrix()
         Camera.capture(self, *mobjects, **kwargs)
 
+    def get_frame_key(self):
+        return (
+            *Camera.get_frame_key(self),
+            self.rotation_matrix.tobytes(),
+            self.get_frame_center().tobytes(),
+            self.get_distance(),
+        )
+
     def get_value_trackers(self):
         return [
             self.phi_tracker,
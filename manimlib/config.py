@@ -6,13 +6,14 @@ import sys
 import types
 
 import manimlib.constants
+from manimlib.constants import DEFAULT_DAEMON_SOCKET_PATH
+from manimlib.constants import STREAMING_URL
 
 
-def parse_cli():
+def parse_cli(argv=None):
     try:
         parser = argparse.ArgumentParser()
-        module_location = parser.add_mutually_exclusive_group()
-        module_location.add_argument(
+        parser.add_argument(
             "file",
             nargs="?",
             help="path to file holding the python code for the scene",
@@ -62,6 +63,16 @@ def parse_cli():
             action="store_true",
             help="Save the video as gif",
         ),
+        parser.add_argument(
+            "--save_raw_frames",
+            action="store_true",
+            help="Write frames to a memory mapped .npy file",
+        ),
+        parser.add_argument(
+            "--gpu_yuv",
+            action="store_true",
+            help="Convert frames to yuv420 on the gpu before writing them",
+        ),
         parser.add_argument(
             "-f", "--show_file_in_finder",
             action="store_true",
@@ -98,6 +109,29 @@ def parse_cli():
                  "in two comma separated values, e.g. \"3,6\", it will end"
                  "the rendering at the second value",
         )
+        parser.add_argument(
+            "--frames",
+            help="Only write the frames \"start,end\" of the animation "
+                 "given by -n, as one shard to be stitched with others",
+        )
+        parser.add_argument(
+            "--shards",
+            type=int,
+            help="Split the longest animation into this many shards, "
+                 "rendered in parallel processes",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            action="store_true",
+            help="While writing a movie, save a checkpoint after each "
+                 "play or wait, which --resume can pick up from",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Pick up a render which didn't finish from the last "
+                 "play or wait it completed, reusing its partial movies",
+        )
         parser.add_argument(
             "-r", "--resolution",
             help="Resolution, passed as \"height,width\"",
@@ -129,32 +163,42 @@ def parse_cli():
             help="directory to write tex",
         )
 
-        # For live streaming
-        module_location.add_argument(
-            "--livestream",
+        # For rendering through a long running process
+        parser.add_argument(
+            "--daemon",
             action="store_true",
-            help="Run in streaming mode",
+            help="Run as a daemon rendering jobs sent with --use_daemon",
         )
         parser.add_argument(
-            "--to-twitch",
+            "--use_daemon",
             action="store_true",
-            help="Stream to twitch",
+            help="Have a running daemon render the scene",
         )
         parser.add_argument(
-            "--with-key",
-            dest="twitch_key",
-            help="Stream key for twitch",
+            "--daemon_socket",
+            default=DEFAULT_DAEMON_SOCKET_PATH,
+            help="Unix socket the daemon listens on",
         )
-        args = parser.parse_args()
 
-        if args.file is None and not args.livestream:
+        # For live streaming
+        parser.add_argument(
+            "--stream_to",
+            nargs="?",
+            const=STREAMING_URL,
+            metavar="URL",
+            help="Stream frames in real time to a url, "
+                 f"e.g. rtmp://host/app/key, by default {STREAMING_URL}",
+        )
+        args = parser.parse_args(argv)
+
+        if args.file is None and not args.daemon:
             parser.print_help()
             sys.exit(2)
-        if args.to_twitch and not args.livestream:
-            print("You must run in streaming mode in order to stream to twitch")
+        if args.frames is not None and args.start_at_animation_number is None:
+            print("Specify the animation to take frames from with -n")
             sys.exit(2)
-        if args.to_twitch and args.twitch_key is None:
-            print("Specify the twitch stream key with --with-key")
+        if (args.checkpoint or args.resume) and (args.start_at_animation_number or args.frames or args.shards):
+            print("--checkpoint and --resume can't be combined with -n, --frames or --shards")
             sys.exit(2)
         return args
     except argparse.ArgumentError as err:
@@ -187,6 +231,8 @@ def get_configuration(args):
         args.write_file,
         args.open,
         args.show_file_in_finder,
+        # Gifs are converted from the movie file
+        args.save_as_gif,
     ])
 
     file_writer_config = {
@@ -195,6 +241,8 @@ def get_configuration(args):
         "save_last_frame": args.skip_animations and write_file,
         "save_pngs": args.save_pngs,
         "save_as_gif": args.save_as_gif,
+        "save_raw_frames": args.save_raw_frames,
+        "gpu_yuv420": args.gpu_yuv,
         # If -t is passed in (for transparent), this will be RGBA
         "png_mode": "RGBA" if args.transparent else "RGB",
         "movie_file_extension": ".mov" if args.transparent else ".mp4",
@@ -203,13 +251,21 @@ def get_configuration(args):
         "open_file_upon_completion": args.open,
         "show_file_location_upon_completion": args.show_file_in_finder,
         "quiet": args.quiet,
+        "render_shard": args.frames is not None,
+        "stream_url": args.stream_to,
     }
     if hasattr(module, "OUTPUT_DIRECTORY"):
         file_writer_config["output_directory"] = module.OUTPUT_DIRECTORY
 
     # If preview wasn't set, but there is no filewriting, preview anyway
     # so that the user sees something
-    if not (args.preview or write_file):
+    if not any([
+        args.preview,
+        write_file,
+        args.save_pngs,
+        args.save_raw_frames,
+        args.stream_to,
+    ]):
         args.preview = True
 
     config = {
@@ -226,6 +282,13 @@ def get_configuration(args):
         "video_dir": args.video_dir,
         "video_output_dir": args.video_output_dir,
         "tex_dir": args.tex_dir,
+        "animation_frame_ranges": {},
+        "default_frame_range": None,
+        "n_shards": args.shards,
+        # A resumed render keeps saving checkpoints, in case
+        # it doesn't finish either
+        "save_checkpoints": args.checkpoint or args.resume,
+        "resume_from_checkpoint": args.resume,
     }
 
     # Camera configuration
@@ -251,6 +314,19 @@ def get_configuration(args):
         args.skip_animations,
         args.start_at_animation_number,
     ])
+
+    if args.frames is not None:
+        # Rather than skipping them, animations before the one being
+        # sharded are updated frame by frame, just as they would be
+        # were they drawn, so the shard starts from the same state
+        start, end = args.frames.split(",")
+        stan = config["start_at_animation_number"]
+        config["animation_frame_ranges"] = {stan: (int(start), int(end))}
+        config["default_frame_range"] = (0, 0)
+        config["start_at_animation_number"] = None
+        config["end_at_animation_number"] = stan + 1
+        config["skip_animations"] = args.skip_animations
+
     return config
 
 
@@ -1,5 +1,7 @@
 import numpy as np
+import getpass
 import os
+import tempfile
 
 MEDIA_DIR = ""
 VIDEO_DIR = ""
@@ -275,17 +277,18 @@ locals().update(COLOR_MAP)
 for name in [s for s in list(COLOR_MAP.keys()) if s.endswith("_C")]:
     locals()[name.replace("_C", "")] = locals()[name]
 
-# Streaming related configuration
-LIVE_STREAM_NAME = "LiveStream"
-TWITCH_STREAM_KEY = "YOUR_STREAM_KEY"
-STREAMING_PROTOCOL = "tcp"
+# Streaming related configuration, watch the default
+# stream with e.g. ffplay udp://127.0.0.1:2000
+STREAMING_PROTOCOL = "udp"
 STREAMING_IP = "127.0.0.1"
 STREAMING_PORT = "2000"
-STREAMING_CLIENT = "ffplay"
-STREAMING_URL = f"{STREAMING_PROTOCOL}://{STREAMING_IP}:{STREAMING_PORT}?listen"
-STREAMING_CONSOLE_BANNER = """
-Manim is now running in streaming mode. Stream animations by passing
-them to manim.play(), e.g.
->>> c = Circle()
->>> manim.play(ShowCreation(c))
-"""
+STREAMING_URL = f"{STREAMING_PROTOCOL}://{STREAMING_IP}:{STREAMING_PORT}"
+
+# Render daemon related configuration.  The socket goes in a
+# directory only its user can reach, see daemon.check_socket_directory
+DEFAULT_DAEMON_SOCKET_DIR = os.environ.get("XDG_RUNTIME_DIR") or os.path.join(
+    tempfile.gettempdir(), f"manim-{getpass.getuser()}"
+)
+DEFAULT_DAEMON_SOCKET_PATH = os.path.join(
+    DEFAULT_DAEMON_SOCKET_DIR, "manim_daemon.sock"
+)
@@ -0,0 +1,208 @@
+import contextlib
+import json
+import os
+import socket
+import sys
+import time
+import traceback
+
+import manimlib
+import manimlib.config
+from manimlib.constants import DEFAULT_DAEMON_SOCKET_DIR
+
+MANIMLIB_DIR = os.path.dirname(os.path.realpath(manimlib.__file__))
+
+
+class JobOutput(object):
+    """
+    Stands in for stdout and stderr while rendering a job,
+    sending everything written back to the client
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def write(self, text):
+        if self.connection is not None:
+            try:
+                send_message(self.connection, {"output": text})
+            except OSError:
+                # The client went away, but the job is still finished
+                self.connection = None
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
+
+def send_message(connection, message):
+    connection.sendall((json.dumps(message) + "\n").encode())
+
+
+def check_socket_directory(socket_path, create=False):
+    """
+    The default socket directory sits somewhere anyone could have
+    made it, so it's only used if it belongs to this user, and no
+    one else can reach into it.  Returns an error message if not.
+    """
+    directory = os.path.dirname(socket_path)
+    if directory != DEFAULT_DAEMON_SOCKET_DIR:
+        return None
+    if create:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+    if not os.path.exists(directory):
+        return None
+    stat = os.lstat(directory)
+    if stat.st_uid != os.getuid() or stat.st_mode & 0o077:
+        return f"{directory} should be a directory only you can access"
+    return None
+
+
+def submit(argv, socket_path):
+    """
+    Sends command line arguments to the daemon listening at
+    socket_path, echoing its output, and returns the exit code
+    """
+    error = check_socket_directory(socket_path)
+    if error is not None:
+        print(error)
+        return 2
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(socket_path)
+    except OSError:
+        print(f"No daemon listening at {socket_path}, start one with --daemon")
+        return 2
+    with client:
+        send_message(client, {"argv": argv, "cwd": os.getcwd()})
+        for line in client.makefile("r"):
+            message = json.loads(line)
+            if "output" in message:
+                sys.stdout.write(message["output"])
+                sys.stdout.flush()
+            elif "exit" in message:
+                return message["exit"]
+    return 1
+
+
+def get_user_modules(directory):
+    # Modules imported from files under directory, other than manimlib's
+    result = {}
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if path is None:
+            continue
+        path = os.path.realpath(path)
+        if not path.startswith(directory):
+            continue
+        if path.startswith(MANIMLIB_DIR) or "site-packages" in path:
+            continue
+        result[name] = path
+    return result
+
+
+def get_mtime(path):
+    return os.path.getmtime(path) if os.path.exists(path) else None
+
+
+def record_module_mtimes(directory, path_to_mtime):
+    # Called after each job, so as to note the modules it imported
+    for name, path in get_user_modules(directory).items():
+        path_to_mtime.setdefault(path, get_mtime(path))
+
+
+def release_changed_modules(directory, path_to_mtime):
+    """
+    If any user module under directory has changed since it was
+    imported, drops all of them from sys.modules, since those which
+    haven't may hold onto names from those which have.  The next
+    job then imports them afresh, while manimlib itself stays loaded.
+    """
+    modules = get_user_modules(directory)
+    if any(
+        path_to_mtime.get(path, get_mtime(path)) != get_mtime(path)
+        for path in modules.values()
+    ):
+        for name, path in modules.items():
+            sys.modules.pop(name)
+            path_to_mtime.pop(path, None)
+
+
+def run_job(request, path_to_mtime):
+    directory = os.path.realpath(request["cwd"])
+    os.chdir(directory)
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    release_changed_modules(directory, path_to_mtime)
+
+    args = manimlib.config.parse_cli(request["argv"])
+    if args.preview or not any([args.write_file, args.open, args.show_file_in_finder]):
+        print("The daemon doesn't open windows, pass -w")
+        return 2
+    start_time = time.time()
+    try:
+        manimlib.run(args)
+    finally:
+        record_module_mtimes(directory, path_to_mtime)
+        clear_job_caches()
+    print(f"Rendered in {time.time() - start_time:.2f} seconds")
+    return 0
+
+
+def clear_job_caches():
+    # What a job leaves in module level caches, other than those keyed
+    # by content, like parsed svg paths and shader code, which the
+    # next job may as well reuse
+    from manimlib.camera.camera import release_standalone_programs
+    release_standalone_programs()
+
+
+def serve(socket_path):
+    """
+    Renders jobs sent by submit, one at a time, in this one process.
+    Between jobs, manimlib stays imported, its shared context stays
+    open, and parsed svg paths stay in memory.
+    """
+    import manimlib.imports
+    import manimlib.camera.camera
+    manimlib.camera.camera.get_standalone_context()
+
+    error = check_socket_directory(socket_path, create=True)
+    if error is not None:
+        print(error)
+        return
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen()
+    print(f"Listening for jobs at {socket_path}")
+
+    path_to_mtime = {}
+    try:
+        while True:
+            connection, _ = server.accept()
+            with connection:
+                request = json.loads(connection.makefile("r").readline())
+                output = JobOutput(connection)
+                cwd = os.getcwd()
+                with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+                    try:
+                        code = run_job(request, path_to_mtime)
+                    except SystemExit as err:
+                        code = err.code if isinstance(err.code, int) else 1
+                    except Exception:
+                        traceback.print_exc()
+                        code = 1
+                os.chdir(cwd)
+                if output.connection is not None:
+                    with contextlib.suppress(OSError):
+                        send_message(connection, {"exit": code})
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        os.remove(socket_path)
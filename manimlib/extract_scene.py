@@ -42,12 +42,8 @@ def prompt_user_for_choice(scene_classes):
         sys.exit(1)
 
 
-def get_scenes_to_render(scene_classes, config):
-    if len(scene_classes) == 0:
-        print(manimlib.constants.NO_SCENE_MESSAGE)
-        return []
-
-    scene_kwargs = dict([
+def get_scene_kwargs(config):
+    return dict([
         (key, config[key])
         for key in [
             "window_config",
@@ -58,9 +54,21 @@ def get_scenes_to_render(scene_classes, config):
             "end_at_animation_number",
             "leave_progress_bars",
             "preview",
+            "animation_frame_ranges",
+            "default_frame_range",
+            "save_checkpoints",
+            "resume_from_checkpoint",
         ]
     ])
 
+
+def get_scenes_to_render(scene_classes, config):
+    if len(scene_classes) == 0:
+        print(manimlib.constants.NO_SCENE_MESSAGE)
+        return []
+
+    scene_kwargs = get_scene_kwargs(config)
+
     if config["write_all"]:
         return [sc(**scene_kwargs) for sc in scene_classes]
 
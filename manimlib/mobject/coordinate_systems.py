@@ -167,7 +167,8 @@ class Axes(VGroup, CoordinateSystem):
         origin = self.x_axis.number_to_point(0)
         result = np.array(origin)
         for axis, coord in zip(self.get_axes(), coords):
-            result += (axis.number_to_point(coord) - origin)
+            # Not in place, so that arrays of coords broadcast
+            result = result + (axis.number_to_point(coord) - origin)
         return result
 
     def c2p(self, *coords):
@@ -1,7 +1,7 @@
 from manimlib.constants import *
 from manimlib.mobject.types.vectorized_mobject import VMobject
+from manimlib.utils.bezier import interpolate
 from manimlib.utils.config_ops import digest_config
-from manimlib.utils.space_ops import get_norm
 
 
 class ParametricFunction(VMobject):
@@ -13,6 +13,16 @@ class ParametricFunction(VMobject):
         "dt": 1e-8,
         # TODO, automatically figure out discontinuities
         "discontinuities": [],
+        # If True, function is assumed to take in a numpy array
+        # of t values and return an array of the corresponding
+        # points, so all samples are taken with a single call
+        "vectorized": False,
+        # If not None, rather than inserting samples based on
+        # step_size, intervals are repeatedly subdivided until
+        # the curve's midpoint lies within this distance of the
+        # chord between neighboring samples
+        "chord_error_tolerance": None,
+        "max_refinement_depth": 12,
     }
 
     def __init__(self, function=None, **kwargs):
@@ -26,6 +36,15 @@ class ParametricFunction(VMobject):
     def get_point_from_function(self, t):
         return self.function(t)
 
+    def get_points_from_function(self, t_range):
+        if len(t_range) == 0:
+            return np.zeros((0, self.dim))
+        if self.vectorized:
+            points = self.function(np.array(t_range))
+        else:
+            points = [self.function(t) for t in t_range]
+        return np.array(points, dtype=float)
+
     def init_points(self):
         t_min, t_max = self.t_min, self.t_max
         dt = self.dt
@@ -43,17 +62,16 @@ class ParametricFunction(VMobject):
         boundary_times.sort()
         for t1, t2 in zip(boundary_times[0::2], boundary_times[1::2]):
             # Get an initial sample of points
-            t_range = list(np.linspace(t1, t2, self.min_samples + 1))
-            samples = [self.function(t) for t in t_range]
+            t_range = np.linspace(t1, t2, self.min_samples + 1)
+            samples = self.get_points_from_function(t_range)
 
-            # Take more samples based on the distances between them
-            norms = [get_norm(p2 - p1) for p1, p2 in zip(samples, samples[1:])]
-            full_t_range = [t1]
-            for s1, s2, norm in zip(t_range, t_range[1:], norms):
-                n_inserts = int(norm / self.step_size)
-                full_t_range += list(np.linspace(s1, s2, n_inserts + 1)[1:])
+            if self.chord_error_tolerance is not None:
+                t_range, points = self.refine_samples(t_range, samples)
+            else:
+                # Take more samples based on the distances between them
+                full_t_range = self.get_full_t_range(t_range, samples)
+                points = self.get_points_from_function(full_t_range)
 
-            points = np.array([self.function(t) for t in full_t_range])
             valid_indices = np.isfinite(points).all(1)
             points = points[valid_indices]
             if len(points) > 0:
@@ -62,6 +80,50 @@ class ParametricFunction(VMobject):
         self.make_smooth()
         return self
 
+    def get_full_t_range(self, t_range, samples):
+        norms = np.linalg.norm(samples[1:] - samples[:-1], axis=1)
+        norms[~np.isfinite(norms)] = 0
+        n_inserts = (norms / self.step_size).astype(int)
+        # Each interval [s1, s2] contributes the values of
+        # np.linspace(s1, s2, n_inserts + 1)[1:]
+        indices = np.repeat(np.arange(len(n_inserts)), n_inserts)
+        offsets = np.arange(len(indices)) - np.repeat(
+            np.cumsum(n_inserts) - n_inserts, n_inserts
+        )
+        s1s = t_range[:-1][indices]
+        s2s = t_range[1:][indices]
+        alphas = (offsets + 1) / n_inserts[indices]
+        return np.hstack([t_range[:1], interpolate(s1s, s2s, alphas)])
+
+    def refine_samples(self, t_range, points):
+        """
+        Subdivides each interval between samples until the
+        curve's midpoint is within chord_error_tolerance of the
+        midpoint of the chord.  Only intervals which were just
+        split get reevaluated, each round with one call to
+        get_points_from_function.
+        """
+        tol = self.chord_error_tolerance
+        active = np.ones(len(t_range) - 1, dtype=bool)
+        for n in range(self.max_refinement_depth):
+            indices = np.where(active)[0]
+            if len(indices) == 0:
+                break
+            mid_ts = 0.5 * (t_range[indices] + t_range[indices + 1])
+            mid_points = self.get_points_from_function(mid_ts)
+            chord_mids = 0.5 * (points[indices] + points[indices + 1])
+            errors = np.linalg.norm(mid_points - chord_mids, axis=1)
+            # Intervals with non-finite errors are left alone
+            to_split = errors > tol
+            split_indices = indices[to_split]
+
+            t_range = np.insert(t_range, split_indices + 1, mid_ts[to_split])
+            points = np.insert(points, split_indices + 1, mid_points[to_split], axis=0)
+            active = np.zeros(len(active), dtype=bool)
+            active[split_indices] = True
+            active = np.insert(active, split_indices + 1, True)
+        return t_range, points
+
 
 class FunctionGraph(ParametricFunction):
     CONFIG = {
@@ -72,8 +134,12 @@ class FunctionGraph(ParametricFunction):
 
     def __init__(self, function, **kwargs):
         digest_config(self, kwargs)
-        self.parametric_function = \
-            lambda t: np.array([t, function(t), 0])
+        if self.vectorized:
+            self.parametric_function = \
+                lambda t: np.array([t, function(t), np.zeros_like(t)]).T
+        else:
+            self.parametric_function = \
+                lambda t: np.array([t, function(t), 0])
         ParametricFunction.__init__(
             self,
             self.parametric_function,
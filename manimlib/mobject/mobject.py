@@ -19,12 +19,13 @@ from manimlib.utils.iterables import batch_by_property
 from manimlib.utils.iterables import list_update
 from manimlib.utils.paths import straight_path
 from manimlib.utils.simple_functions import get_parameters
+from manimlib.utils.simple_functions import is_vectorized
 from manimlib.utils.space_ops import angle_of_vector
 from manimlib.utils.space_ops import get_norm
 from manimlib.utils.space_ops import rotation_matrix_transpose
 from manimlib.utils.shaders import get_shader_info
-from manimlib.utils.shaders import shader_info_to_id
-from manimlib.utils.shaders import shader_id_to_info
+from manimlib.utils.shaders import ShaderInfo
+from manimlib.utils.shaders import shader_info_to_batch_key
 from manimlib.utils.shaders import is_valid_shader_info
 
 
@@ -355,14 +356,22 @@ class Mobject(Container):
         self.apply_points_function_about_point(func, **kwargs)
         return self
 
-    def apply_function(self, function, **kwargs):
+    def apply_function(self, function, vectorized=None, **kwargs):
         # Default to applying matrix about the origin, not mobjects center
         if len(kwargs) == 0:
             kwargs["about_point"] = ORIGIN
-        self.apply_points_function_about_point(
-            lambda points: np.array([function(p) for p in points]),
-            **kwargs
-        )
+        if vectorized is None:
+            vectorized = is_vectorized(function)
+        if vectorized:
+            # Pass all points of the family through function at once
+            self.apply_points_function_about_point(
+                function, works_on_family=True, **kwargs
+            )
+        else:
+            self.apply_points_function_about_point(
+                lambda points: np.array([function(p) for p in points]),
+                **kwargs
+            )
         return self
 
     def apply_function_to_position(self, function):
@@ -387,16 +396,27 @@ class Mobject(Container):
         )
         return self
 
-    def apply_complex_function(self, function, **kwargs):
-        def R3_func(point):
-            x, y, z = point
-            xy_complex = function(complex(x, y))
-            return [
-                xy_complex.real,
-                xy_complex.imag,
-                z
-            ]
-        return self.apply_function(R3_func)
+    def apply_complex_function(self, function, vectorized=None, **kwargs):
+        if vectorized is None:
+            vectorized = is_vectorized(function)
+        if vectorized:
+            # function takes in a complex array
+            def R3_func(points):
+                xy_complex = function(points[:, 0] + 1j * points[:, 1])
+                result = np.array(points)
+                result[:, 0] = np.real(xy_complex)
+                result[:, 1] = np.imag(xy_complex)
+                return result
+        else:
+            def R3_func(point):
+                x, y, z = point
+                xy_complex = function(complex(x, y))
+                return [
+                    xy_complex.real,
+                    xy_complex.imag,
+                    z
+                ]
+        return self.apply_function(R3_func, vectorized=vectorized, **kwargs)
 
     def wag(self, direction=RIGHT, axis=DOWN, wag_factor=1.0):
         for mob in self.family_members_with_points():
@@ -427,12 +447,25 @@ class Mobject(Container):
     # Note, much of these are now redundant with default behavior of
     # above methods
 
-    def apply_points_function_about_point(self, func, about_point=None, about_edge=None):
+    def apply_points_function_about_point(self, func, about_point=None, about_edge=None,
+                                          works_on_family=False):
+        """
+        If works_on_family is True, the points of all family members
+        are stacked and passed through func with a single call.
+        """
         if about_point is None:
             if about_edge is None:
                 about_edge = ORIGIN
             about_point = self.get_bounding_box_point(about_edge)
-        for mob in self.family_members_with_points():
+        mobs = self.family_members_with_points()
+        if works_on_family and len(mobs) > 1:
+            all_points = np.vstack([mob.points for mob in mobs])
+            new_points = func(all_points - about_point) + about_point
+            split_indices = np.cumsum([len(mob.points) for mob in mobs])[:-1]
+            for mob, points in zip(mobs, np.split(new_points, split_indices)):
+                mob.points[:] = points
+            return self
+        for mob in mobs:
             mob.points -= about_point
             mob.points[:] = func(mob.points)
             mob.points += about_point
@@ -775,7 +808,16 @@ class Mobject(Container):
     # Getters
 
     def get_points_defining_boundary(self):
-        return self.get_all_points()
+        if self.submobjects:
+            return np.vstack([
+                sm.get_own_points_defining_boundary()
+                for sm in self.get_family()
+            ])
+        return self.get_own_points_defining_boundary()
+
+    def get_own_points_defining_boundary(self):
+        # For subclasses whose points don't trace out their shape
+        return self.points
 
     def get_num_points(self):
         return len(self.points)
@@ -1154,23 +1196,36 @@ class Mobject(Container):
     def unlock_shader_data(self):
         self.shader_data_is_locked = False
 
-    def get_shader_info_list(self):
+    def get_shader_info_list(self, cull_func=None):
+        """
+        cull_func, if given, is called on each family member, and
+        those for which it returns True contribute no shader data
+        """
         if self.shader_data_is_locked:
             return self.saved_shader_info_list
 
+        if cull_func is not None and cull_func(self):
+            own_infos = []
+        else:
+            own_infos = [self.get_shader_info()]
         shader_infos = it.chain(
-            [self.get_shader_info()],
+            own_infos,
             *[
-                submob.get_shader_info_list()
+                submob.get_shader_info_list(cull_func)
                 for submob in self.submobjects
             ]
         )
-        batches = batch_by_property(shader_infos, shader_info_to_id)
+        batches = batch_by_property(shader_infos, shader_info_to_batch_key)
 
         result = []
-        for info_group, sid in batches:
-            shader_info = shader_id_to_info(sid)
-            shader_info["data"] = np.hstack([info["data"] for info in info_group])
+        for info_group, key in batches:
+            if len(info_group) == 1:
+                shader_info = info_group[0]
+            else:
+                shader_info = ShaderInfo(
+                    info_group[0].descriptor,
+                    np.hstack([info.data for info in info_group]),
+                )
             if is_valid_shader_info(shader_info):
                 result.append(shader_info)
         return result
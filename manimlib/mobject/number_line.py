@@ -104,9 +104,11 @@ class NumberLine(Line):
         )
 
     def number_to_point(self, number):
-        alpha = float(number - self.x_min) / (self.x_max - self.x_min)
+        # Also accepts an array of numbers, returning one point per row
+        number = np.array(number, dtype=float)
+        alpha = (number - self.x_min) / (self.x_max - self.x_min)
         return interpolate(
-            self.get_start(), self.get_end(), alpha
+            self.get_start(), self.get_end(), alpha[..., np.newaxis]
         )
 
     def point_to_number(self, point):
@@ -21,6 +21,10 @@ from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.utils.color import *
 from manimlib.utils.config_ops import digest_config
 
+# Points of parsed path strings, by hash, kept in memory on top of
+# their copies in MOBJECT_POINTS_DIR for long running processes
+PATH_HASH_TO_POINTS = {}
+
 
 def string_to_numbers(num_string):
     num_string = num_string.replace("-", ",-")
@@ -343,7 +347,9 @@ class VMobjectFromSVGPathstring(VMobject):
             f"{path_hash}.npy"
         )
 
-        if os.path.exists(filepath):
+        if path_hash in PATH_HASH_TO_POINTS:
+            self.points = PATH_HASH_TO_POINTS[path_hash].copy()
+        elif os.path.exists(filepath):
             self.points = np.load(filepath)
         else:
             self.relative_point = np.array(ORIGIN)
@@ -357,6 +363,7 @@ class VMobjectFromSVGPathstring(VMobject):
             self.stretch(-1, 1, about_point=ORIGIN)
             # Save to a file for future use
             np.save(filepath, self.points)
+        PATH_HASH_TO_POINTS[path_hash] = self.points.copy()
         # Faster rendering
         self.lock_triangulation()
 
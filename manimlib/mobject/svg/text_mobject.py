@@ -2,7 +2,6 @@ import re
 import os
 import copy
 import hashlib
-import cairo
 import manimlib.constants as consts
 from manimlib.constants import *
 from manimlib.mobject.svg.svg_mobject import SVGMobject
@@ -101,6 +100,7 @@ class Text(SVGMobject):
                 self[start:end].set_color_by_gradient(*gradient)
 
     def str2slant(self, string):
+        import cairo
         if string == NORMAL:
             return cairo.FontSlant.NORMAL
         if string == ITALIC:
@@ -109,6 +109,7 @@ class Text(SVGMobject):
             return cairo.FontSlant.OBLIQUE
 
     def str2weight(self, string):
+        import cairo
         if string == NORMAL:
             return cairo.FontWeight.NORMAL
         if string == BOLD:
@@ -183,6 +184,7 @@ class Text(SVGMobject):
         if os.path.exists(file_name):
             return file_name
 
+        import cairo
         surface = cairo.SVGSurface(file_name, 600, 400)
         context = cairo.Context(surface)
         context.set_font_size(size)
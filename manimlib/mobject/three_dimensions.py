@@ -32,13 +32,22 @@ class ParametricSurface(VGroup):
         "stroke_width": 0.5,
         "should_make_jagged": False,
         "pre_function_handle_to_anchor_scale_factor": 0.00001,
+        # If True, func is assumed to take in arrays of u and v
+        # values, and return an array of points, one per row
+        "vectorized": False,
     }
 
     def __init__(self, func, **kwargs):
         VGroup.__init__(self, **kwargs)
         self.func = func
         self.setup_in_uv_space()
-        self.apply_function(lambda p: func(p[0], p[1]))
+        if self.vectorized:
+            self.apply_function(
+                lambda p: func(p[:, 0], p[:, 1]),
+                vectorized=True,
+            )
+        else:
+            self.apply_function(lambda p: func(p[0], p[1]))
         if self.should_make_jagged:
             self.make_jagged()
 
@@ -23,7 +23,8 @@ from manimlib.utils.space_ops import cross2d
 from manimlib.utils.space_ops import get_norm
 from manimlib.utils.space_ops import angle_between_vectors
 from manimlib.utils.space_ops import earclip_triangulation
-from manimlib.utils.shaders import get_shader_info
+from manimlib.utils.shaders import ShaderInfo
+from manimlib.utils.shaders import get_shader_descriptor
 
 
 class VMobject(Mobject):
@@ -56,6 +57,13 @@ class VMobject(Mobject):
         "fill_vert_shader_file": "quadratic_bezier_fill_vert.glsl",
         "fill_geom_shader_file": "quadratic_bezier_fill_geom.glsl",
         "fill_frag_shader_file": "quadratic_bezier_fill_frag.glsl",
+        # Fills with the nonzero winding rule on the gpu, so that no
+        # triangulation is needed, which helps for shapes whose points
+        # change every frame.  Each path is then drawn on its own, with
+        # only the first of its fill colors.
+        "use_stencil_fill": False,
+        "stencil_fill_vert_shader_file": "quadratic_bezier_fill_stencil_vert.glsl",
+        "stencil_fill_frag_shader_file": "quadratic_bezier_fill_stencil_frag.glsl",
         # Could also be Bevel, Miter, Round
         "joint_type": "auto",
         "render_primative": moderngl.TRIANGLES,
@@ -66,6 +74,10 @@ class VMobject(Mobject):
             ('fill_all', np.float32, (1,)),
             ('orientation', np.float32, (1,)),
         ],
+        "stencil_fill_dtype": [
+            ('point', np.float32, (3,)),
+            ('curve_coords', np.float32, (2,)),
+        ],
         "stroke_dtype": [
             ("point", np.float32, (3,)),
             ("prev_point", np.float32, (3,)),
@@ -502,8 +514,21 @@ class VMobject(Mobject):
         return self
 
     def add_points_as_corners(self, points):
-        for point in points:
-            self.add_line_to(point)
+        if self.long_lines or len(points) == 0:
+            for point in points:
+                self.add_line_to(point)
+            return points
+        # Equivalent to calling add_line_to on each point,
+        # but with only one append
+        self.throw_error_if_no_points()
+        nppc = self.n_points_per_curve
+        anchors = np.vstack([self.points[-1:], points])
+        new_points = np.zeros((nppc * len(points), self.dim))
+        for index, alpha in enumerate(np.linspace(0, 1, nppc)):
+            new_points[index::nppc] = interpolate(anchors[:-1], anchors[1:], alpha)
+        if self.has_new_path_started():
+            new_points = new_points[1:]
+        self.append_points(new_points)
         return points
 
     def set_points_as_corners(self, points):
@@ -563,8 +588,8 @@ class VMobject(Mobject):
         self.append_points(new_points)
 
     # TODO, how to be smart about tangents here?
-    def apply_function(self, function):
-        Mobject.apply_function(self, function)
+    def apply_function(self, function, **kwargs):
+        Mobject.apply_function(self, function, **kwargs)
         if self.make_smooth_after_applying_functions:
             self.make_smooth()
         return self
@@ -583,29 +608,36 @@ class VMobject(Mobject):
     # Information about the curve
     def get_bezier_tuples_from_points(self, points):
         nppc = self.n_points_per_curve
+        points = np.array(points)
         remainder = len(points) % nppc
         points = points[:len(points) - remainder]
-        return np.array([
-            points[i:i + nppc]
-            for i in range(0, len(points), nppc)
-        ])
+        return points.reshape((len(points) // nppc, nppc, *points.shape[1:]))
 
     def get_bezier_tuples(self):
         return self.get_bezier_tuples_from_points(self.get_points())
 
-    def get_subpaths_from_points(self, points):
+    def get_subpath_split_indices(self, points):
         nppc = self.n_points_per_curve
-        split_indices = filter(
-            lambda n: not self.consider_points_equals(points[n - 1], points[n]),
-            range(nppc, len(points), nppc)
-        )
-        split_indices = [0, *split_indices, len(points)]
+        # Same test as consider_points_equals, done for all
+        # curve boundaries at once
+        candidates = np.arange(nppc, len(points), nppc)
+        is_continuous = np.isclose(
+            points[candidates - 1], points[candidates],
+            atol=self.tolerance_for_point_equality
+        ).all(1)
+        split_indices = [0, *candidates[~is_continuous], len(points)]
         return [
-            points[i1:i2]
+            (i1, i2)
             for i1, i2 in zip(split_indices, split_indices[1:])
             if (i2 - i1) >= nppc
         ]
 
+    def get_subpaths_from_points(self, points):
+        return [
+            points[i1:i2]
+            for i1, i2 in self.get_subpath_split_indices(points)
+        ]
+
     def get_subpaths(self):
         return self.get_subpaths_from_points(self.get_points())
 
@@ -666,10 +698,36 @@ class VMobject(Mobject):
         return norms.sum()
 
     # Alignment
+    def null_point_align(self, mobject):
+        self.align_instancing(mobject)
+        return super().null_point_align(mobject)
+
+    def align_submobjects(self, mobject):
+        self.align_instancing(mobject)
+        return super().align_submobjects(mobject)
+
+    def align_instancing(self, mobject):
+        # Instanced vmobjects only interpolate with one another, so one
+        # aligned with anything else pushes its copies into submobjects,
+        # and the other its own points, leaving two plain groups
+        for mob1, mob2 in (self, mobject), (mobject, self):
+            if isinstance(mob1, InstancedVMobject) and not isinstance(mob2, InstancedVMobject):
+                mob1.push_instances_into_submobjects()
+                if mob2.has_points():
+                    mob2.push_self_into_submobjects()
+        return self
+
     def align_points(self, vmobject):
+        self.prepare_to_align_points(vmobject)
+        plan1, plan2 = self.get_alignment_plan(vmobject)
+        self.apply_alignment_plan(plan1)
+        vmobject.apply_alignment_plan(plan2)
+        return self
+
+    def prepare_to_align_points(self, vmobject):
         self.align_rgbas(vmobject)
         if len(self.points) == len(vmobject.points):
-            return
+            return self
 
         for mob in self, vmobject:
             # If there are no points, add one to
@@ -680,34 +738,82 @@ class VMobject(Mobject):
             # a null curve
             if mob.has_new_path_started():
                 mob.add_line_to(mob.points[0])
+        return self
 
-        # Figure out what the subpaths are, and align
-        subpaths1 = self.get_subpaths()
-        subpaths2 = vmobject.get_subpaths()
-        n_subpaths = max(len(subpaths1), len(subpaths2))
-        # Start building new ones
-        new_subpaths1 = []
-        new_subpaths2 = []
+    def get_alignment_insertions(self, vmobject):
+        """
+        Returns a pair of tuples, one for each of self and vmobject, each
+        of which is either None, meaning the points are left alone, or has
+        a triple (first_curve, ipc, n_collapsed) for each subpath.  ipc
+        holds the number of curves to insert into each curve of the
+        subpath starting at first_curve, unless the subpath is a null
+        path at the very end, where n_collapsed pieces of the curve
+        first_curve all collapse to its final point.
+        """
+        if len(self.points) == len(vmobject.points):
+            return (None, None)
 
         nppc = self.n_points_per_curve
+        curve_ranges1, curve_ranges2 = [
+            [(i1 // nppc, i2 // nppc) for i1, i2 in mob.get_subpath_split_indices(mob.points)]
+            for mob in (self, vmobject)
+        ]
+        bezier_tuples1, bezier_tuples2 = self.get_bezier_tuples(), vmobject.get_bezier_tuples()
+        insertions = [[], []]
+        for n in range(max(len(curve_ranges1), len(curve_ranges2))):
+            cr1, cr2 = [
+                # A null path at the very end
+                crs[n] if n < len(crs) else (crs[-1][1] - 1, None)
+                for crs in (curve_ranges1, curve_ranges2)
+            ]
+            len1, len2 = [1 if cr[1] is None else cr[1] - cr[0] for cr in (cr1, cr2)]
+            for mob, mob_insertions, bezier_tuples, cr, diff in [
+                (self, insertions[0], bezier_tuples1, cr1, max(0, len2 - len1)),
+                (vmobject, insertions[1], bezier_tuples2, cr2, max(0, len1 - len2)),
+            ]:
+                if cr[1] is None:
+                    mob_insertions.append((cr[0], None, diff + 1))
+                else:
+                    ipc = mob.get_insertions_per_curve(diff, bezier_tuples[cr[0]:cr[1]])
+                    mob_insertions.append((cr[0], tuple(ipc), None))
+        return tuple(map(tuple, insertions))
 
-        def get_nth_subpath(path_list, n):
-            if n >= len(path_list):
-                # Create a null path at the very end
-                return [path_list[-1][-1]] * nppc
-            return path_list[n]
-
-        for n in range(n_subpaths):
-            sp1 = get_nth_subpath(subpaths1, n)
-            sp2 = get_nth_subpath(subpaths2, n)
-            diff1 = max(0, (len(sp2) - len(sp1)) // nppc)
-            diff2 = max(0, (len(sp1) - len(sp2)) // nppc)
-            sp1 = self.insert_n_curves_to_point_list(diff1, sp1)
-            sp2 = self.insert_n_curves_to_point_list(diff2, sp2)
-            new_subpaths1.append(sp1)
-            new_subpaths2.append(sp2)
-        self.set_points(np.vstack(new_subpaths1))
-        vmobject.set_points(np.vstack(new_subpaths2))
+    def get_alignment_plan(self, vmobject):
+        """
+        Returns a pair of plans, one for each of self and vmobject, each of
+        which is either None, meaning the points are left alone, or a triple
+        (curve_indices, a1s, a2s) describing each new curve as the portion
+        over [a1, a2] of one of the current curves.
+        """
+        return tuple(map(
+            self.get_plan_from_insertions,
+            self.get_alignment_insertions(vmobject),
+        ))
+
+    def get_plan_from_insertions(self, insertions):
+        if insertions is None:
+            return None
+        parts = []
+        for first_curve, ipc, n_collapsed in insertions:
+            if ipc is None:
+                # Every piece collapses to the final point
+                parts.append((
+                    np.full(n_collapsed, first_curve),
+                    np.ones(n_collapsed),
+                    np.ones(n_collapsed),
+                ))
+            else:
+                indices, a1s, a2s = self.get_insertion_plan_from_counts(
+                    np.array(ipc, dtype=int)
+                )
+                parts.append((indices + first_curve, a1s, a2s))
+        return tuple(np.hstack(arrays) for arrays in zip(*parts))
+
+    def apply_alignment_plan(self, plan):
+        if plan is not None:
+            self.set_points(self.get_points_from_insertion_plan(
+                self.get_bezier_tuples(), plan
+            ))
         return self
 
     def insert_n_curves(self, n):
@@ -726,14 +832,24 @@ class VMobject(Mobject):
             return np.repeat(points, nppc * n, 0)
 
         bezier_groups = self.get_bezier_tuples_from_points(points)
-        norms = np.array([
-            get_norm(bg[nppc - 1] - bg[0])
-            for bg in bezier_groups
-        ])
+        return self.get_points_from_insertion_plan(
+            bezier_groups,
+            self.get_curve_insertion_plan(n, bezier_groups)
+        )
+
+    def get_curve_insertion_plan(self, n, bezier_groups):
+        return self.get_insertion_plan_from_counts(
+            self.get_insertions_per_curve(n, bezier_groups)
+        )
+
+    def get_insertions_per_curve(self, n, bezier_groups):
+        nppc = self.n_points_per_curve
+        norms = np.linalg.norm(bezier_groups[:, nppc - 1] - bezier_groups[:, 0], axis=1)
         total_norm = sum(norms)
         # Calculate insertions per curve (ipc)
         if total_norm < 1e-6:
-            ipc = [n] + [0] * (len(bezier_groups) - 1)
+            ipc = np.zeros(len(bezier_groups), dtype=int)
+            ipc[0] = n
         else:
             ipc = np.round(n * norms / sum(norms)).astype(int)
 
@@ -742,16 +858,43 @@ class VMobject(Mobject):
             ipc[np.argmin(ipc)] += 1
         for x in range(-diff):
             ipc[np.argmax(ipc)] -= 1
+        return ipc
+
+    def get_insertion_plan_from_counts(self, ipc):
+        # What was once a single quadratic curve defined by a
+        # bezier group will now be broken into n_inserts + 1
+        # smaller quadratic curves
+        n_pieces = ipc + 1
+        group_indices = np.repeat(np.arange(len(ipc)), n_pieces)
+        piece_indices = np.arange(len(group_indices)) - np.repeat(
+            np.cumsum(n_pieces) - n_pieces, n_pieces
+        )
+        a1s = piece_indices / n_pieces[group_indices]
+        a2s = (piece_indices + 1) / n_pieces[group_indices]
+        return group_indices, a1s, a2s
+
+    def get_points_from_insertion_plan(self, bezier_groups, plan):
+        nppc = self.n_points_per_curve
+        group_indices, a1s, a2s = plan
+        a1s = a1s[:, np.newaxis]
+        a2s = a2s[:, np.newaxis]
+        b0s, b1s, b2s = [
+            bezier_groups[group_indices, i]
+            for i in range(nppc)
+        ]
+
+        # The control points of the portion of a quadratic bezier
+        # curve over [a1, a2] are given by its blossom evaluated at
+        # (a1, a1), (a1, a2) and (a2, a2)
+        def blossom(u, v):
+            return (1 - u) * (1 - v) * b0s + (u * (1 - v) + (1 - u) * v) * b1s + u * v * b2s
 
-        new_points = []
-        for group, n_inserts in zip(bezier_groups, ipc):
-            # What was once a single quadratic curve defined
-            # by "group" will now be broken into n_inserts + 1
-            # smaller quadratic curves
-            alphas = np.linspace(0, 1, n_inserts + 2)
-            for a1, a2 in zip(alphas, alphas[1:]):
-                new_points += partial_bezier_points(group, a1, a2)
-        return np.vstack(new_points)
+        dim = bezier_groups.shape[2]
+        new_points = np.zeros((len(group_indices), nppc, dim))
+        new_points[:, 0] = blossom(a1s, a1s)
+        new_points[:, 1] = blossom(a1s, a2s)
+        new_points[:, 2] = blossom(a2s, a2s)
+        return new_points.reshape((-1, dim))
 
     def align_rgbas(self, vmobject):
         attrs = ["fill_rgbas", "stroke_rgbas"]
@@ -766,15 +909,18 @@ class VMobject(Mobject):
                 setattr(self, attr, new_a1)
         return self
 
-    def interpolate_color(self, mobject1, mobject2, alpha):
-        attrs = [
+    def get_color_array_attrs(self):
+        # Arrays which interpolate_color linearly interpolates
+        return [
             "fill_rgbas",
             "stroke_rgbas",
             "stroke_width",
             # "sheen_direction",
             # "sheen_factor",
         ]
-        for attr in attrs:
+
+    def interpolate_color(self, mobject1, mobject2, alpha):
+        for attr in self.get_color_array_attrs():
             m1a = getattr(mobject1, attr)
             m2a = getattr(mobject2, attr)
             setattr(self, attr, interpolate(m1a, m2a, alpha))
@@ -828,36 +974,55 @@ class VMobject(Mobject):
     # For shaders
     def init_shader_data(self):
         self.fill_data = np.zeros(len(self.points), dtype=self.fill_dtype)
+        self.stencil_fill_data = np.zeros(0, dtype=self.stencil_fill_dtype)
         self.stroke_data = np.zeros(len(self.points), dtype=self.stroke_dtype)
 
-    def get_shader_info_list(self):
+    def get_shader_info_list(self, cull_func=None):
         if self.shader_data_is_locked:
             return self.saved_shader_info_list
 
-        stroke_info = get_shader_info(
+        stroke_descriptor = get_shader_descriptor(
             vert_file=self.stroke_vert_shader_file,
             geom_file=self.stroke_geom_shader_file,
             frag_file=self.stroke_frag_shader_file,
             texture_path=self.texture_path,
             render_primative=self.render_primative,
         )
-        fill_info = get_shader_info(
-            vert_file=self.fill_vert_shader_file,
-            geom_file=self.fill_geom_shader_file,
-            frag_file=self.fill_frag_shader_file,
-            texture_path=self.texture_path,
-            render_primative=self.render_primative,
-        )
+        fill_descriptor = self.get_fill_shader_descriptor()
 
         back_stroke_data = []
         stroke_data = []
         fill_data = []
+        stencil_fill_infos = []
+        result = []
+
+        def flush():
+            if back_stroke_data:
+                result.append(ShaderInfo(stroke_descriptor, np.hstack(back_stroke_data)))
+            if fill_data:
+                result.append(ShaderInfo(fill_descriptor, np.hstack(fill_data)))
+            result.extend(stencil_fill_infos)
+            if stroke_data:
+                result.append(ShaderInfo(stroke_descriptor, np.hstack(stroke_data)))
+            for data_list in back_stroke_data, stroke_data, fill_data, stencil_fill_infos:
+                data_list.clear()
+
         for submob in self.family_members_with_points():
+            if cull_func is not None and cull_func(submob):
+                continue
+            if isinstance(submob, InstancedVMobject):
+                # These have draw calls of their own, so what's been
+                # gathered so far is drawn first, keeping family order
+                flush()
+                result += submob.get_instanced_shader_info_list()
+                continue
             stroke_width = submob.get_stroke_width()
             stroke_opacity = submob.get_stroke_opacity()
             fill_opacity = submob.get_fill_opacity()
 
-            if fill_opacity > 0:
+            if fill_opacity > 0 and submob.use_stencil_fill:
+                stencil_fill_infos.append(submob.get_stencil_fill_shader_info())
+            elif fill_opacity > 0:
                 fill_data.append(submob.get_fill_shader_data())
 
             if stroke_width > 0 and stroke_opacity > 0:
@@ -866,18 +1031,7 @@ class VMobject(Mobject):
                 else:
                     data = stroke_data
                 data.append(submob.get_stroke_shader_data())
-
-        result = []
-        if back_stroke_data:
-            back_stroke_info = dict(stroke_info)  # Copy
-            back_stroke_info["data"] = np.hstack(back_stroke_data)
-            result.append(back_stroke_info)
-        if fill_data:
-            fill_info["data"] = np.hstack(fill_data)
-            result.append(fill_info)
-        if stroke_data:
-            stroke_info["data"] = np.hstack(stroke_data)
-            result.append(stroke_info)
+        flush()
         return result
 
     def get_stroke_shader_data(self):
@@ -920,6 +1074,12 @@ class VMobject(Mobject):
         for sm in self.family_members_with_points():
             sm.triangulation_locked = False
 
+    def set_stencil_fill(self, use_stencil_fill=True, family=True):
+        mobs = self.get_family() if family else [self]
+        for mob in mobs:
+            mob.use_stencil_fill = use_stencil_fill
+        return self
+
     def refresh_triangulation(self):
         for sm in self.get_family():
             if sm.triangulation_locked:
@@ -1010,6 +1170,63 @@ class VMobject(Mobject):
 
         return data
 
+    def get_fill_shader_descriptor(self):
+        return get_shader_descriptor(
+            vert_file=self.fill_vert_shader_file,
+            geom_file=self.fill_geom_shader_file,
+            frag_file=self.fill_frag_shader_file,
+            texture_path=self.texture_path,
+            render_primative=self.render_primative,
+        )
+
+    def get_fill_shader_info(self):
+        return ShaderInfo(self.get_fill_shader_descriptor(), self.get_fill_shader_data())
+
+    def get_stencil_fill_shader_info(self):
+        descriptor = get_shader_descriptor(
+            vert_file=self.stencil_fill_vert_shader_file,
+            frag_file=self.stencil_fill_frag_shader_file,
+            texture_path=self.texture_path,
+            render_primative=moderngl.TRIANGLES,
+        )
+        return ShaderInfo(
+            descriptor,
+            self.get_stencil_fill_shader_data(),
+            fill_rgba=np.array(self.get_fill_rgbas()[0]),
+            fill_fallback=self.get_fill_shader_info,
+        )
+
+    def get_stencil_fill_shader_data(self):
+        # Each curve gives two triangles, one fanning out from the start
+        # of its subpath to the curve's ends, and one holding the curve
+        # itself, with coordinates in which the curve is u^2 = v.  Adding
+        # up the signed coverage of these gives the winding number.
+        nppc = self.n_points_per_curve
+        points = self.points
+        split_indices = self.get_subpath_split_indices(points)
+        if not split_indices:
+            return self.get_blank_shader_data_array(0, "stencil_fill_data")
+        starts = [i1 for i1, i2 in split_indices]
+        counts = [(i2 - i1) // nppc for i1, i2 in split_indices]
+        curves = np.vstack([
+            points[i1:i1 + nppc * n]
+            for i1, n in zip(starts, counts)
+        ]).reshape((-1, nppc, self.dim))
+        pivots = np.repeat(points[starts], counts, axis=0)
+
+        data = self.get_blank_shader_data_array(6 * len(curves), "stencil_fill_data")
+        data["point"] = np.stack([
+            pivots, curves[:, 0], curves[:, 2],
+            curves[:, 0], curves[:, 1], curves[:, 2],
+        ], 1).reshape((-1, self.dim))
+        # Points of the fan triangle all get coordinates
+        # inside the curve, so are always counted
+        data["curve_coords"] = np.tile(
+            [[0, 1], [0, 1], [0, 1], [0, 0], [0.5, 0], [1, 1]],
+            (len(curves), 1)
+        )
+        return data
+
 
 class VGroup(VMobject):
     def __init__(self, *vmobjects, **kwargs):
@@ -1019,6 +1236,187 @@ class VGroup(VMobject):
         self.add(*vmobjects)
 
 
+class InstancedVMobject(VMobject):
+    """
+    Draws many copies of one template vmobject with a single instanced
+    draw call, each copy placed by its own affine map and tinted by its
+    own rgba.  An instance is tracked by four points, its origin and the
+    images of the three unit vectors, so that the usual methods moving
+    points around act on every copy at once.  Nonlinear functions are
+    only applied to these points, not to the geometry of each copy.
+    Colors and stroke width start as those of the template, and are
+    then shared by every copy, with instance_rgbas multiplying them.
+
+    Partial curves, as with ShowCreation, are taken of the template, so
+    that every copy is drawn in at once.  Aligned with anything other
+    than an InstancedVMobject, as for a Transform, the copies become
+    plain submobjects, see push_instances_into_submobjects.
+    """
+    CONFIG = {
+        # Used in place of the template's own vertex shaders, while
+        # the rest of the family is drawn as for any VMobject
+        "instanced_stroke_vert_shader_file": "quadratic_bezier_stroke_instanced_vert.glsl",
+        "instanced_fill_vert_shader_file": "quadratic_bezier_fill_instanced_vert.glsl",
+        "instance_dtype": [
+            ("instance_matrix", np.float32, (3, 3)),
+            ("instance_shift", np.float32, (3,)),
+            ("instance_color", np.float32, (4,)),
+        ],
+    }
+
+    def __init__(self, template, shifts=None, matrices=None, rgbas=None, **kwargs):
+        self.template = template.copy()
+        # The template never changes shape, so its fill is triangulated
+        self.template.set_stencil_fill(False)
+        VMobject.__init__(self, **kwargs)
+        if shifts is None:
+            shifts = [ORIGIN]
+        self.set_instances(shifts, matrices, rgbas)
+        for attr in VMobject.get_color_array_attrs(self):
+            setattr(self, attr, np.array(getattr(template, attr)))
+
+    def copy(self):
+        # Each copy gets its own template, whose style it sets
+        # before drawing, see update_template_style
+        result = super().copy()
+        result.template = self.template.copy()
+        return result
+
+    def update_template_style(self):
+        for attr in VMobject.get_color_array_attrs(self):
+            setattr(self.template, attr, getattr(self, attr))
+        return self
+
+    def set_instances(self, shifts, matrices=None, rgbas=None):
+        shifts = np.array(shifts, dtype=float).reshape((-1, self.dim))
+        n_instances = len(shifts)
+        if matrices is None:
+            matrices = np.identity(self.dim)
+        matrices = np.broadcast_to(matrices, (n_instances, self.dim, self.dim))
+        if rgbas is None:
+            rgbas = np.ones(4)
+        frames = np.zeros((n_instances, self.dim + 1, self.dim))
+        frames[:, 0] = shifts
+        frames[:, 1:] = shifts[:, np.newaxis, :] + np.transpose(matrices, (0, 2, 1))
+        self.set_points(frames.reshape((-1, self.dim)))
+        self.instance_rgbas = np.array(np.broadcast_to(rgbas, (n_instances, 4)))
+        return self
+
+    def get_num_instances(self):
+        return len(self.points) // (self.dim + 1)
+
+    def get_instance_frames(self):
+        return self.points.reshape((-1, self.dim + 1, self.dim))
+
+    def get_instance_shifts(self):
+        return self.get_instance_frames()[:, 0]
+
+    def get_instance_matrices(self):
+        frames = self.get_instance_frames()
+        return np.transpose(frames[:, 1:] - frames[:, :1], (0, 2, 1))
+
+    def get_own_points_defining_boundary(self):
+        template_points = self.template.get_points_defining_boundary()
+        placed_points = np.einsum(
+            "nij,mj->nmi", self.get_instance_matrices(), template_points
+        ) + self.get_instance_shifts()[:, np.newaxis, :]
+        return placed_points.reshape((-1, self.dim))
+
+    def get_color_array_attrs(self):
+        return [*super().get_color_array_attrs(), "instance_rgbas"]
+
+    def align_points(self, mobject):
+        if not isinstance(mobject, InstancedVMobject):
+            return super().align_points(mobject)
+        self.align_rgbas(mobject)
+        n_instances = max(self.get_num_instances(), mobject.get_num_instances())
+        for mob in self, mobject:
+            if mob.get_num_instances() < n_instances:
+                frames = stretch_array_to_length(mob.get_instance_frames(), n_instances)
+                mob.set_points(frames.reshape((-1, mob.dim)))
+                mob.instance_rgbas = stretch_array_to_length(mob.instance_rgbas, n_instances)
+        return self
+
+    def interpolate_color(self, mobject1, mobject2, alpha):
+        attrs = VMobject.get_color_array_attrs(self)
+        if all(isinstance(mob, InstancedVMobject) for mob in (mobject1, mobject2)):
+            attrs.append("instance_rgbas")
+        for attr in attrs:
+            m1a = getattr(mobject1, attr)
+            m2a = getattr(mobject2, attr)
+            setattr(self, attr, interpolate(m1a, m2a, alpha))
+
+    def pointwise_become_partial(self, vmobject, a, b):
+        if not isinstance(vmobject, InstancedVMobject):
+            return super().pointwise_become_partial(vmobject, a, b)
+        self.points[:] = vmobject.points
+        for tm1, tm2 in zip(self.template.get_family(), vmobject.template.get_family()):
+            tm1.pointwise_become_partial(tm2, a, b)
+        return self
+
+    def get_instance_copies(self):
+        # Plain vmobjects drawing the same as each instance
+        self.update_template_style()
+        copies = []
+        for matrix, shift, rgba in zip(
+            self.get_instance_matrices(),
+            self.get_instance_shifts(),
+            self.instance_rgbas,
+        ):
+            copy = self.template.copy()
+            for mob in copy.get_family():
+                mob.set_points(np.dot(mob.points, matrix.T) + shift)
+                mob.fill_rgbas = mob.fill_rgbas * rgba
+                mob.stroke_rgbas = mob.stroke_rgbas * rgba
+            copies.append(copy)
+        return copies
+
+    def push_instances_into_submobjects(self):
+        self.set_submobjects([*self.get_instance_copies(), *self.submobjects])
+        self.set_instances(np.zeros((0, self.dim)))
+        return self
+
+    # For shaders
+    def init_shader_data(self):
+        super().init_shader_data()
+        self.instance_data = np.zeros(0, dtype=self.instance_dtype)
+
+    def get_instance_shader_data(self):
+        data = self.get_blank_shader_data_array(self.get_num_instances(), "instance_data")
+        # Rows here are the columns of each matrix, as glsl expects
+        frames = self.get_instance_frames()
+        data["instance_matrix"] = frames[:, 1:] - frames[:, :1]
+        data["instance_shift"] = frames[:, 0]
+        data["instance_color"] = self.instance_rgbas
+        return data
+
+    def get_instanced_shader_info_list(self):
+        # Infos for drawing the copies of the template, which
+        # VMobject.get_shader_info_list places among those
+        # of the rest of the family
+        vert_file_map = {
+            self.template.stroke_vert_shader_file: self.instanced_stroke_vert_shader_file,
+            self.template.fill_vert_shader_file: self.instanced_fill_vert_shader_file,
+        }
+        self.update_template_style()
+        instance_data = self.get_instance_shader_data()
+        result = []
+        for template_info in self.template.get_shader_info_list():
+            template_descriptor = template_info.descriptor
+            descriptor = get_shader_descriptor(
+                vert_file=vert_file_map[template_descriptor.vert],
+                geom_file=template_descriptor.geom,
+                frag_file=template_descriptor.frag,
+                texture_path=template_descriptor.texture_path,
+                render_primative=template_descriptor.render_primative,
+            )
+            result.append(ShaderInfo(
+                descriptor, template_info.data,
+                instance_data=instance_data,
+            ))
+        return result
+
+
 class VectorizedPoint(VMobject, Point):
     CONFIG = {
         "color": BLACK,
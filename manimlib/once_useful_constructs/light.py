@@ -1,7 +1,5 @@
 from traceback import *
 
-from scipy.spatial import ConvexHull
-
 from manimlib.animation.composition import LaggedStartMap
 from manimlib.animation.fading import FadeIn
 from manimlib.animation.fading import FadeOut
@@ -547,6 +545,7 @@ class LightSource(VMobject):
 
         point_cloud_2d = rotated_point_cloud_3d[:, :2]
         # now we can compute the convex hull
+        from scipy.spatial import ConvexHull
         hull_2d = ConvexHull(point_cloud_2d)  # guaranteed to run ccw
         hull = []
 
@@ -136,9 +136,10 @@ class GraphScene(Scene):
 
     def coords_to_point(self, x, y):
         assert(hasattr(self, "x_axis") and hasattr(self, "y_axis"))
-        result = self.x_axis.number_to_point(x)[0] * RIGHT
-        result += self.y_axis.number_to_point(y)[1] * UP
-        return result
+        # x and y may also be arrays, giving one point per row
+        x_coord = self.x_axis.number_to_point(x)[..., 0]
+        y_coord = self.y_axis.number_to_point(y)[..., 1]
+        return np.multiply.outer(x_coord, RIGHT) + np.multiply.outer(y_coord, UP)
 
     def point_to_coords(self, point):
         return (self.x_axis.point_to_number(point),
@@ -161,8 +162,9 @@ class GraphScene(Scene):
         def parameterized_function(alpha):
             x = interpolate(x_min, x_max, alpha)
             y = func(x)
-            if not np.isfinite(y):
-                y = self.y_max
+            # Written to work on arrays as well, for when
+            # the graph is built with vectorized=True
+            y = np.where(np.isfinite(y), y, self.y_max)
             return self.coords_to_point(x, y)
 
         graph = ParametricFunction(
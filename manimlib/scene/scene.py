@@ -1,13 +1,16 @@
+import copyreg
 import inspect
+import io
+import pickle
 import random
 import warnings
 import platform
 import itertools as it
 
+from colour import Color
 from tqdm import tqdm as ProgressDisplay
 import numpy as np
 import time
-from IPython.terminal.embed import InteractiveShellEmbed
 
 from manimlib.animation.animation import Animation
 from manimlib.animation.transform import MoveToTarget
@@ -19,7 +22,6 @@ from manimlib.mobject.mobject import Mobject
 from manimlib.scene.scene_file_writer import SceneFileWriter
 from manimlib.utils.family_ops import extract_mobject_family_members
 from manimlib.utils.family_ops import restructure_list_to_exclude_certain_family_members
-from manimlib.window import Window
 
 
 class Scene(Container):
@@ -36,11 +38,30 @@ class Scene(Container):
         "leave_progress_bars": False,
         "preview": True,
         "linger_after_completion": True,
+        # Maps animation numbers to the range of frames, [start, end),
+        # of that play or wait which should be drawn and written.  The
+        # others are only updated, e.g. when rendering across shards
+        "animation_frame_ranges": {},
+        # Frame range of those animations not given one above
+        "default_frame_range": None,
+        # For scenes whose state depends only on time, rather than on
+        # the path taken, frames before a frame range are fast forwarded
+        # through with a single update rather than one per frame
+        "fast_forward_analytically": False,
+        # While writing a movie, save a checkpoint after each play or
+        # wait.  When resuming from it, construct skips through to that
+        # point, after which the attributes of the scene and of its
+        # mobjects, and the random number generators, are restored
+        # from the checkpoint
+        "save_checkpoints": False,
+        "resume_from_checkpoint": False,
     }
 
     def __init__(self, **kwargs):
         Container.__init__(self, **kwargs)
         if self.preview:
+            # Imported here, so that only previews pay for pyglet
+            from manimlib.window import Window
             self.window = Window(self, **self.window_config)
             self.camera_config["ctx"] = self.window.ctx
             self.virtual_animation_start_time = 0
@@ -52,10 +73,18 @@ class Scene(Container):
         self.file_writer = SceneFileWriter(self, **self.file_writer_config)
         self.mobjects = []
         self.num_plays = 0
+        self.animation_frame_counts = {}
         self.time = 0
         self.skip_time = 0
         self.original_skipping_status = self.skip_animations
         self.time_of_last_frame = time.time()
+        self.checkpoint = None
+        # Maps classes to those attributes which checkpoints leave out
+        self.unpicklable_checkpoint_attrs = {}
+        if self.resume_from_checkpoint:
+            self.checkpoint = self.file_writer.load_checkpoint()
+            if self.checkpoint is not None:
+                self.skip_animations = True
 
         # Items associated with interaction
         self.mouse_point = Point()
@@ -69,12 +98,17 @@ class Scene(Container):
             np.random.seed(self.random_seed)
 
     def run(self):
-        self.setup()
         try:
-            self.construct()
-        except EndSceneEarlyException:
-            pass
-        self.tear_down()
+            self.setup()
+            try:
+                self.construct()
+            except EndSceneEarlyException:
+                pass
+            self.tear_down()
+        finally:
+            # Even when construct fails, as the context may go
+            # on to render other scenes
+            self.camera.release()
 
     def setup(self):
         """
@@ -114,6 +148,7 @@ class Scene(Container):
         self.linger_after_completion = False
         self.update_frame()
 
+        from IPython.terminal.embed import InteractiveShellEmbed
         shell = InteractiveShellEmbed()
         # Have the frame update after each command
         shell.events.register('post_run_cell', lambda *a,
@@ -135,6 +170,7 @@ class Scene(Container):
         if self.skip_animations and not ignore_skipping:
             return
 
+        draw_start_time = time.time()
         if self.window:
             self.window.clear()
         self.camera.clear()
@@ -142,12 +178,35 @@ class Scene(Container):
 
         if self.window:
             self.window.swap_buffers()
-            # win_time, win_dt = self.window.timer.next_frame()
-            # while (self.time - self.skip_time - win_time) > 0:
-            vt = self.time - self.virtual_animation_start_time
-            rt = time.time() - self.real_animation_start_time
-            if rt < vt:
-                self.update_frame(0)
+            self.window.record_frame(time.time() - draw_start_time)
+            # When ahead of real time, wait for it to catch up
+            lag = self.get_real_time_lag()
+            if lag < 0:
+                self.window.sleep(-lag)
+
+    def get_real_time_lag(self, dt=0):
+        # How far a preview showing the frame dt from now
+        # is behind real time, in seconds
+        vt = self.time + dt - self.virtual_animation_start_time
+        rt = time.time() - self.real_animation_start_time
+        return rt - vt
+
+    def should_drop_frame(self, dt):
+        # Previews whose frames take too long to draw drop
+        # them until caught up with real time, unless those
+        # frames are also being written
+        if self.window is None or self.skip_animations:
+            return False
+        if self.file_writer.is_writing_frames():
+            return False
+        if self.get_real_time_lag(dt) > 1 / self.camera.frame_rate:
+            self.window.record_dropped_frame()
+            return True
+        return False
+
+    def update_without_drawing(self, dt):
+        self.increment_time(dt)
+        self.update_mobjects(dt)
 
     def emit_frame(self):
         if not self.skip_animations:
@@ -251,6 +310,50 @@ class Scene(Container):
         )
         return time_progression
 
+    def get_num_frames(self, run_time):
+        return len(np.arange(0, run_time, 1 / self.camera.frame_rate))
+
+    def get_frame_range(self):
+        # The frames [start, end) of the current play or wait to
+        # draw, or None if all of them should be
+        return self.animation_frame_ranges.get(
+            self.num_plays, self.default_frame_range
+        )
+
+    def should_write_animation(self):
+        frame_range = self.get_frame_range()
+        return frame_range is None or frame_range[0] < frame_range[1]
+
+    def is_last_animation(self):
+        if self.end_at_animation_number is None:
+            return False
+        return self.num_plays + 1 >= self.end_at_animation_number
+
+    def get_frames(self, time_progression):
+        """
+        Yields the time, time step and whether to draw for each
+        frame of the current play or wait, taking into account
+        its frame range, and in previews, real time
+        """
+        frame_range = self.get_frame_range()
+        if frame_range is None or self.skip_animations:
+            start, end = 0, np.inf
+        else:
+            start, end = frame_range
+        last_t = 0
+        for index, t in enumerate(time_progression):
+            if index >= end and self.is_last_animation():
+                # Nothing after this will be written
+                time_progression.close()
+                break
+            if index < start < end and self.fast_forward_analytically:
+                # The time step of the first drawn frame covers these
+                continue
+            dt = t - last_t
+            last_t = t
+            draw = start <= index < end and not self.should_drop_frame(dt)
+            yield t, dt, draw
+
     def get_run_time(self, animations):
         return np.max([animation.run_time for animation in animations])
 
@@ -347,7 +450,7 @@ class Scene(Container):
     def handle_play_like_call(func):
         def wrapper(self, *args, **kwargs):
             self.update_skipping_status()
-            should_write = not self.skip_animations
+            should_write = not self.skip_animations and self.should_write_animation()
             if should_write:
                 self.file_writer.begin_animation()
 
@@ -361,6 +464,13 @@ class Scene(Container):
                 self.file_writer.end_animation()
 
             self.num_plays += 1
+            # Checkpoints are taken, and restored, right after the
+            # play or wait, before the code following it in construct
+            if self.checkpoint is not None:
+                if self.num_plays == self.checkpoint["num_plays"]:
+                    self.restore_checkpoint()
+            elif should_write and self.save_checkpoints:
+                self.save_checkpoint()
         return wrapper
 
     def lock_static_mobject_data(self, *animations):
@@ -392,16 +502,17 @@ class Scene(Container):
                 self.add(mob)
 
     def progress_through_animations(self, animations):
-        last_t = 0
-        for t in self.get_animation_time_progression(animations):
-            dt = t - last_t
-            last_t = t
+        time_progression = self.get_animation_time_progression(animations)
+        for t, dt, draw in self.get_frames(time_progression):
             for animation in animations:
                 animation.update_mobjects(dt)
                 alpha = t / animation.run_time
                 animation.interpolate(alpha)
-            self.update_frame(dt)
-            self.emit_frame()
+            if draw:
+                self.update_frame(dt)
+                self.emit_frame()
+            else:
+                self.update_without_drawing(dt)
 
     def finish_animations(self, animations):
         for animation in animations:
@@ -421,6 +532,9 @@ class Scene(Container):
             warnings.warn("Called Scene.play with no animations")
             return
         animations = self.anims_from_play_args(*args, **kwargs)
+        self.animation_frame_counts[self.num_plays] = self.get_num_frames(
+            self.get_run_time(animations)
+        )
         self.lock_static_mobject_data(*animations)
         self.begin_animations(animations)
         self.progress_through_animations(animations)
@@ -458,26 +572,33 @@ class Scene(Container):
     def wait(self, duration=DEFAULT_WAIT_TIME, stop_condition=None):
         self.update_mobjects(dt=0)  # Any problems with this?
         if self.should_update_mobjects():
+            self.animation_frame_counts[self.num_plays] = self.get_num_frames(duration)
             self.lock_static_mobject_data()
             time_progression = self.get_wait_time_progression(
                 duration, stop_condition)
-            last_t = 0
-            for t in time_progression:
-                dt = t - last_t
-                last_t = t
-                self.update_frame(dt)
-                self.emit_frame()
+            for t, dt, draw in self.get_frames(time_progression):
+                if draw:
+                    self.update_frame(dt)
+                    self.emit_frame()
+                else:
+                    self.update_without_drawing(dt)
                 if stop_condition is not None and stop_condition():
                     time_progression.close()
                     break
             self.unlock_mobject_data()
-        elif self.skip_animations:
+            return self
+
+        n_frames = int(duration * self.camera.frame_rate)
+        self.animation_frame_counts[self.num_plays] = n_frames
+        if self.skip_animations:
             # Do nothing
             return self
+        elif not self.should_write_animation():
+            self.update_without_drawing(duration)
         else:
             self.update_frame(duration)
-            n_frames = int(duration * self.camera.frame_rate)
-            for n in range(n_frames):
+            start, end = self.get_frame_range() or (0, n_frames)
+            for n in range(max(start, 0), min(end, n_frames)):
                 self.emit_frame()
         return self
 
@@ -504,6 +625,95 @@ class Scene(Container):
         self.update_frame(ignore_skipping=True)
         self.get_image().show()
 
+    # Checkpoints
+    def get_checkpoint_objects(self):
+        # The scene and the families of its mobjects and camera frame,
+        # whose attributes are saved.  Anything else in those attributes
+        # is saved by value
+        return [
+            self,
+            *extract_mobject_family_members([*self.mobjects, self.camera.frame]),
+        ]
+
+    def get_checkpoint_attrs(self, obj):
+        if obj is self:
+            excluded = CHECKPOINT_EXCLUDED_SCENE_ATTRS
+        else:
+            excluded = CHECKPOINT_EXCLUDED_MOBJECT_ATTRS
+        unpicklable = self.unpicklable_checkpoint_attrs.get(obj.__class__)
+        if unpicklable:
+            excluded = unpicklable.union(excluded)
+        return dict([
+            (attr, value)
+            for attr, value in obj.__dict__.items()
+            if attr not in excluded
+        ])
+
+    def find_unpicklable_checkpoint_attrs(self, objects):
+        pickler = CheckpointPickler(io.BytesIO(), objects)
+        found = []
+        for obj in objects:
+            attrs = self.get_checkpoint_attrs(obj)
+            pickler.clear_memo()
+            try:
+                pickler.dump(attrs)
+                continue
+            except Exception:
+                pass
+            for attr, value in attrs.items():
+                pickler.clear_memo()
+                try:
+                    pickler.dump(value)
+                except Exception:
+                    excluded = self.unpicklable_checkpoint_attrs.setdefault(obj.__class__, set())
+                    excluded.add(attr)
+                    found.append(f"{obj.__class__.__name__}.{attr}")
+        if found:
+            warnings.warn(
+                "These attributes can't be pickled, so when resuming from "
+                "a checkpoint they're left as construct made them: " + ", ".join(found)
+            )
+
+    def dump_checkpoint_states(self, objects):
+        # One pickle for everything, sharing a memo
+        return dump_checkpoint_state([
+            self.get_checkpoint_attrs(obj)
+            for obj in objects
+        ], objects)
+
+    def save_checkpoint(self):
+        objects = self.get_checkpoint_objects()
+        try:
+            states = self.dump_checkpoint_states(objects)
+        except Exception:
+            # Whatever can't be pickled is left out from then on
+            self.find_unpicklable_checkpoint_attrs(objects)
+            states = self.dump_checkpoint_states(objects)
+        self.file_writer.save_checkpoint({
+            "num_plays": self.num_plays,
+            "random_state": random.getstate(),
+            "numpy_random_state": np.random.get_state(),
+            "object_classes": [obj.__class__.__name__ for obj in objects],
+            "object_states": states,
+        })
+
+    def restore_checkpoint(self):
+        checkpoint = self.checkpoint
+        self.checkpoint = None
+        objects = self.get_checkpoint_objects()
+        if [obj.__class__.__name__ for obj in objects] == checkpoint["object_classes"]:
+            states = load_checkpoint_state(checkpoint["object_states"], objects)
+            for obj, state in zip(objects, states):
+                obj.__dict__.update(state)
+        else:
+            warnings.warn(
+                "Objects in the scene don't match those in the checkpoint, "
+                "so they're left as they were after skipping ahead"
+            )
+        random.setstate(checkpoint["random_state"])
+        np.random.set_state(checkpoint["numpy_random_state"])
+        self.stop_skipping()
+
     # Helpers for interactive development
     def save_state(self):
         self.saved_state = {
@@ -569,5 +779,98 @@ class Scene(Container):
         pass
 
 
+# Attributes of a scene which concern how it's rendered,
+# or resumed, rather than what's in it, and so which
+# aren't saved in checkpoints
+CHECKPOINT_EXCLUDED_SCENE_ATTRS = set([
+    "window",
+    "window_config",
+    "camera",
+    "camera_config",
+    "file_writer",
+    "file_writer_config",
+    "checkpoint",
+    "unpicklable_checkpoint_attrs",
+    "save_checkpoints",
+    "resume_from_checkpoint",
+    "skip_animations",
+    "original_skipping_status",
+    "skip_time",
+    "start_at_animation_number",
+    "end_at_animation_number",
+    "time_of_last_frame",
+    "real_animation_start_time",
+    "virtual_animation_start_time",
+])
+
+# Buffers which mobjects refill from their points and colors
+# whenever they're drawn, and so which checkpoints leave out
+CHECKPOINT_EXCLUDED_MOBJECT_ATTRS = set([
+    "shader_data",
+    "fill_data",
+    "stencil_fill_data",
+    "stroke_data",
+    "instance_data",
+    "saved_shader_info_list",
+])
+
+
+def get_checkpoint_object(index):
+    # Stands in for the objects referred to by a checkpoint,
+    # and is swapped for a lookup of them when it's loaded
+    raise Exception("Only CheckpointUnpickler can load checkpoint objects")
+
+
+def reduce_color(color):
+    return (Color, (color.get_hex_l(),))
+
+
+class CheckpointPickler(pickle.Pickler):
+    """
+    Pickles the objects whose attributes make up a checkpoint as
+    references to them, by index.  This goes through reducers for
+    their classes, rather than persistent_id, which would be called
+    for everything pickled
+    """
+    def __init__(self, file, objects):
+        pickle.Pickler.__init__(self, file, pickle.HIGHEST_PROTOCOL)
+        self.object_indices = dict([
+            (id(obj), index)
+            for index, obj in enumerate(objects)
+        ])
+        self.dispatch_table = copyreg.dispatch_table.copy()
+        # Colors hold onto a lambda, which can't be pickled
+        self.dispatch_table[Color] = reduce_color
+        for obj in objects:
+            self.dispatch_table[obj.__class__] = self.reduce_object
+
+    def reduce_object(self, obj):
+        index = self.object_indices.get(id(obj))
+        if index is None:
+            return obj.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+        return (get_checkpoint_object, (index,))
+
+
+class CheckpointUnpickler(pickle.Unpickler):
+    def __init__(self, file, objects):
+        pickle.Unpickler.__init__(self, file)
+        self.objects = objects
+
+    def find_class(self, module, name):
+        if (module, name) == (__name__, "get_checkpoint_object"):
+            return self.objects.__getitem__
+        return pickle.Unpickler.find_class(self, module, name)
+
+
+def dump_checkpoint_state(state, objects):
+    buffer = io.BytesIO()
+    CheckpointPickler(buffer, objects).dump(state)
+    return buffer.getvalue()
+
+
+def load_checkpoint_state(data, objects):
+    return CheckpointUnpickler(io.BytesIO(data), objects).load()
+
+
 class EndSceneEarlyException(Exception):
     pass
@@ -1,10 +1,19 @@
 import numpy as np
-from pydub import AudioSegment
+import hashlib
+import mmap
 import shutil
+import struct
 import subprocess as sp
 import os
+import pickle
 import sys
 import platform
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
 
 import manimlib.constants as consts
 from manimlib.constants import FFMPEG_BIN
@@ -14,16 +23,44 @@ from manimlib.utils.file_ops import add_extension_if_not_present
 from manimlib.utils.file_ops import get_sorted_integer_files
 from manimlib.utils.sounds import get_full_sound_file_path
 
+# Raw frames are written after a header of this fixed size, leaving
+# room to fill in the number of frames once they are all written
+NPY_HEADER_SIZE = 128
+
+# ffmpeg formats of raw audio, by bytes per sample
+PCM_SAMPLE_WIDTH_TO_FORMAT = {
+    1: "u8",
+    2: "s16le",
+    3: "s24le",
+    4: "s32le",
+}
+
 
 class SceneFileWriter(object):
     CONFIG = {
         "write_to_movie": False,
-        # TODO, save_pngs is doing nothing
+        # Write each frame as a png, in a subdirectory of images
         "save_pngs": False,
         "png_mode": "RGBA",
+        # Pngs are compressed and written on a pool of this many
+        # threads, defaulting to one per cpu, with at most
+        # max_pending_pngs frames waiting on them at a time
+        "n_png_threads": None,
+        "max_pending_pngs": 8,
+        # Write the rgba bytes of each frame into a memory mapped
+        # .npy file, of shape (frames, height, width, 4), whose
+        # rows run from the bottom up as in the frame buffer.
+        # Space is added raw_frame_chunk_size frames at a time
+        "save_raw_frames": False,
+        "raw_frame_chunk_size": 60,
         "save_last_frame": False,
         "movie_file_extension": ".mp4",
         "gif_file_extension": ".gif",
+        # Also convert the movie to a gif, at this frame rate and
+        # pixel width, keeping the aspect ratio
+        "save_as_gif": False,
+        "gif_frame_rate": 15,
+        "gif_pixel_width": 480,
         # Previous output_file_name
         # TODO, address this in extract_scene et. al.
         "file_name": None,
@@ -32,6 +69,21 @@ class SceneFileWriter(object):
         "open_file_upon_completion": False,
         "show_file_location_upon_completion": False,
         "quiet": False,
+        # Convert frames to yuv420p on the gpu, rather than
+        # having ffmpeg do so from rgba
+        "gpu_yuv420": False,
+        # Only write the frame range of a single animation, as one
+        # shard of it to be stitched together with the others
+        "render_shard": False,
+        # Stream frames, in real time, to a url such as
+        # udp://127.0.0.1:2000 or rtmp://host/app/key.  The
+        # format defaults to flv for rtmp and mpegts otherwise
+        "stream_url": None,
+        "stream_format": None,
+        "stream_keyframe_interval": 15,
+        # Frames waiting on the encoder beyond this many are dropped,
+        # rather than holding up the scene
+        "max_pending_stream_frames": 2,
     }
 
     def __init__(self, scene, **kwargs):
@@ -39,12 +91,20 @@ class SceneFileWriter(object):
         self.scene = scene
         self.init_output_directories()
         self.init_audio()
+        self.last_frame_version = None
+        self.written_partial_movie_files = []
+        if self.save_pngs:
+            self.init_png_writing()
+        if self.save_raw_frames:
+            self.init_raw_frame_writing()
+        if self.stream_url is not None:
+            self.init_streaming()
 
     # Output directories and files
     def init_output_directories(self):
         module_directory = self.output_directory or self.get_default_module_directory()
         scene_name = self.file_name or self.get_default_scene_name()
-        if self.save_last_frame:
+        if self.save_last_frame or self.save_pngs:
             if consts.VIDEO_DIR != "":
                 image_dir = guarantee_existence(os.path.join(
                     consts.VIDEO_DIR,
@@ -60,7 +120,9 @@ class SceneFileWriter(object):
                 image_dir,
                 add_extension_if_not_present(scene_name, ".png")
             )
-        if self.write_to_movie:
+            self.png_directory = os.path.join(image_dir, scene_name)
+            self.png_file_prefix = scene_name
+        if self.write_to_movie or self.save_raw_frames:
             if consts.VIDEO_DIR != "":
                 movie_dir = guarantee_existence(os.path.join(
                     consts.VIDEO_DIR,
@@ -81,11 +143,22 @@ class SceneFileWriter(object):
                     scene_name, self.gif_file_extension
                 )
             )
+            self.raw_frames_file_path = os.path.join(
+                movie_dir,
+                add_extension_if_not_present(scene_name, ".npy")
+            )
             self.partial_movie_directory = guarantee_existence(os.path.join(
                 movie_dir,
                 "partial_movie_files",
                 scene_name,
             ))
+            # Kept apart from the partial movie files, which
+            # are cleared of anything not named by an index
+            self.shard_directory = os.path.join(
+                movie_dir,
+                "partial_movie_files",
+                scene_name + "_shards",
+            )
 
     def get_default_module_directory(self):
         filename = os.path.basename(self.input_file_path)
@@ -110,28 +183,81 @@ class SceneFileWriter(object):
         return self.image_file_path
 
     def get_next_partial_movie_path(self):
-        result = os.path.join(
+        if self.render_shard:
+            start, end = self.scene.get_frame_range()
+            return self.get_shard_movie_path(self.scene.num_plays, start)
+        return self.get_partial_movie_path(self.scene.num_plays)
+
+    def get_partial_movie_path(self, animation_number):
+        return os.path.join(
             self.partial_movie_directory,
-            "{:05}{}".format(
-                self.scene.num_plays,
-                self.movie_file_extension,
-            )
+            f"{animation_number:05}{self.movie_file_extension}",
+        )
+
+    def get_shard_movie_path(self, animation_number, start_frame):
+        guarantee_existence(self.shard_directory)
+        return os.path.join(
+            self.shard_directory,
+            f"{animation_number:05}_{start_frame:06}{self.movie_file_extension}",
         )
-        return result
 
     def get_movie_file_path(self):
         return self.movie_file_path
 
+    def get_checkpoint_path(self):
+        # Cleared along with other files not named by
+        # an index once the movie files are combined
+        return os.path.join(self.partial_movie_directory, "checkpoint.pkl")
+
+    def get_audio_log_path(self):
+        return os.path.join(self.partial_movie_directory, "audio_log.pkl")
+
+    def get_png_file_path(self, frame_number):
+        return os.path.join(
+            self.png_directory,
+            f"{self.png_file_prefix}_{frame_number:05}.png",
+        )
+
     # Sound
     def init_audio(self):
         self.includes_sound = False
+        # Bytes of the audio log, which checkpoints point into
+        self.audio_log_size = 0
 
     def create_audio_segment(self):
+        # pydub is only imported by scenes with sound
+        from pydub import AudioSegment
         self.audio_segment = AudioSegment.silent()
 
     def add_audio_segment(self, new_segment,
                           time=None,
                           gain_to_background=None):
+        self.mix_audio_segment(new_segment, time, gain_to_background)
+        if self.is_saving_checkpoints():
+            self.log_audio_segment(new_segment, time, gain_to_background)
+
+    def log_audio_segment(self, *args):
+        # Each segment is appended to a log, rather than the whole
+        # sound being saved with each checkpoint.  Anything past the
+        # end of what's been logged is left from an earlier run
+        file_path = self.get_audio_log_path()
+        mode = "r+b" if self.audio_log_size > 0 else "wb"
+        with open(file_path, mode) as fp:
+            fp.seek(self.audio_log_size)
+            pickle.dump(args, fp, protocol=pickle.HIGHEST_PROTOCOL)
+            fp.truncate()
+            self.audio_log_size = fp.tell()
+
+    def load_audio_log(self, size):
+        with open(self.get_audio_log_path(), "rb") as fp:
+            while fp.tell() < size:
+                self.mix_audio_segment(*pickle.load(fp))
+        self.audio_log_size = size
+
+    def mix_audio_segment(self, new_segment,
+                          time=None,
+                          gain_to_background=None):
+        from pydub import AudioSegment
         if not self.includes_sound:
             self.includes_sound = True
             self.create_audio_segment()
@@ -156,6 +282,7 @@ class SceneFileWriter(object):
         )
 
     def add_sound(self, sound_file, time=None, gain=None, **kwargs):
+        from pydub import AudioSegment
         file_path = get_full_sound_file_path(sound_file)
         new_segment = AudioSegment.from_file(file_path)
         if gain:
@@ -163,18 +290,346 @@ class SceneFileWriter(object):
         self.add_audio_segment(new_segment, time, **kwargs)
 
     # Writers
+    def is_writing_frames(self):
+        return any([
+            self.write_to_movie,
+            self.save_pngs,
+            self.save_raw_frames,
+            self.stream_url is not None,
+        ])
+
     def begin_animation(self):
         if self.write_to_movie:
             self.open_movie_pipe()
+        if self.stream_url is not None and self.stream_process is None:
+            # One stream runs across all animations
+            self.open_stream_pipe()
 
     def end_animation(self):
         if self.write_to_movie:
             self.close_movie_pipe()
 
     def write_frame(self, camera):
+        if self.save_pngs:
+            self.write_png(camera)
+        if self.save_raw_frames:
+            self.write_raw_frame(camera)
+        if self.write_to_movie or self.stream_url is not None:
+            # Frames identical to the last one written, as
+            # during holds, reuse its bytes rather than
+            # reading back from the frame buffer again
+            if camera.state_version != self.last_frame_version:
+                if self.use_gpu_yuv420:
+                    self.last_frame_bytes = camera.get_raw_yuv420_data()
+                else:
+                    self.last_frame_bytes = camera.get_raw_fbo_data()
+                self.last_frame_version = camera.state_version
         if self.write_to_movie:
-            raw_bytes = camera.get_raw_fbo_data()
-            self.writing_process.stdin.write(raw_bytes)
+            self.writing_process.stdin.write(self.last_frame_bytes)
+        if self.stream_url is not None:
+            self.write_stream_frame(self.last_frame_bytes)
+
+    def init_png_writing(self):
+        guarantee_existence(self.png_directory)
+        self.n_pngs = 0
+        self.last_png_version = None
+        self.last_png_future = None
+        self.png_pool = ThreadPoolExecutor(
+            self.n_png_threads or os.cpu_count() or 1
+        )
+        self.png_slots = threading.BoundedSemaphore(self.max_pending_pngs)
+        self.png_errors = []
+
+    def write_png(self, camera):
+        file_path = self.get_png_file_path(self.n_pngs)
+        self.n_pngs += 1
+        if camera.state_version != self.last_png_version:
+            task = (
+                self.encode_png,
+                camera.get_raw_fbo_data(),
+                camera.get_pixel_shape(),
+                file_path,
+            )
+        else:
+            # Frames repeated during holds are copies of the first
+            task = (
+                self.copy_png,
+                self.last_png_future,
+                self.last_png_path,
+                file_path,
+            )
+        # Blocks when the pool falls behind, bounding memory use
+        self.png_slots.acquire()
+        future = self.png_pool.submit(*task)
+        future.add_done_callback(self.on_png_written)
+        if camera.state_version != self.last_png_version:
+            self.last_png_version = camera.state_version
+            self.last_png_future = future
+            self.last_png_path = file_path
+
+    def encode_png(self, data, size, file_path):
+        # Wraps the bytes read from the frame buffer without copying,
+        # flipping it, as its rows run from the bottom up
+        image = Image.frombuffer("RGBA", size, data, "raw", "RGBA", 0, -1)
+        if self.png_mode != "RGBA":
+            image = image.convert(self.png_mode)
+        image.save(file_path)
+
+    def copy_png(self, source_future, source_path, file_path):
+        source_future.result()
+        shutil.copyfile(source_path, file_path)
+
+    def on_png_written(self, future):
+        self.png_slots.release()
+        if future.exception() is not None:
+            self.png_errors.append(future.exception())
+
+    def finish_png_writing(self):
+        self.png_pool.shutdown(wait=True)
+        if self.png_errors:
+            raise self.png_errors[0]
+        self.print_file_ready_message(self.png_directory)
+
+    def init_raw_frame_writing(self):
+        self.raw_frames_file = open(self.raw_frames_file_path, "wb+")
+        self.raw_frames_map = None
+        self.n_raw_frames = 0
+        self.raw_frame_capacity = 0
+        self.last_raw_frame_version = None
+        width, height = self.scene.camera.get_pixel_shape()
+        self.raw_frame_shape = (height, width, self.scene.camera.n_channels)
+        self.raw_frame_size = int(np.prod(self.raw_frame_shape))
+        self.write_npy_header()
+
+    def write_npy_header(self):
+        header = "{{'descr': '|u1', 'fortran_order': False, 'shape': {}, }}".format(
+            (self.n_raw_frames, *self.raw_frame_shape)
+        )
+        # Magic string, version and header length take 10 bytes
+        header = header.ljust(NPY_HEADER_SIZE - 11) + "\n"
+        self.raw_frames_file.seek(0)
+        self.raw_frames_file.write(b"\x93NUMPY\x01\x00")
+        self.raw_frames_file.write(struct.pack("<H", len(header)))
+        self.raw_frames_file.write(header.encode("latin1"))
+
+    def resize_raw_frames_file(self, n_frames):
+        if self.raw_frames_map is not None:
+            self.raw_frames_map.close()
+            self.raw_frames_map = None
+        size = NPY_HEADER_SIZE + n_frames * self.raw_frame_size
+        self.raw_frames_file.truncate(size)
+        if n_frames > 0:
+            self.raw_frames_map = mmap.mmap(self.raw_frames_file.fileno(), size)
+        self.raw_frame_capacity = n_frames
+
+    def write_raw_frame(self, camera):
+        if self.n_raw_frames == self.raw_frame_capacity:
+            self.resize_raw_frames_file(
+                self.raw_frame_capacity + self.raw_frame_chunk_size
+            )
+        start = NPY_HEADER_SIZE + self.n_raw_frames * self.raw_frame_size
+        if camera.state_version == self.last_raw_frame_version:
+            # Repeat the last frame without reading it back again
+            self.raw_frames_map.move(
+                start, start - self.raw_frame_size, self.raw_frame_size
+            )
+        else:
+            with memoryview(self.raw_frames_map) as view:
+                camera.read_raw_fbo_data_into(
+                    view[start:start + self.raw_frame_size]
+                )
+            self.last_raw_frame_version = camera.state_version
+        self.n_raw_frames += 1
+
+    def finish_raw_frame_writing(self):
+        self.resize_raw_frames_file(self.n_raw_frames)
+        self.write_npy_header()
+        self.raw_frames_file.close()
+        self.print_file_ready_message(self.raw_frames_file_path)
+
+    def init_streaming(self):
+        self.stream_process = None
+        self.stream_queue = queue.Queue(self.max_pending_stream_frames)
+        self.n_sent_stream_frames = 0
+        # Frames are dropped by the render thread when the queue is
+        # full, and by the sender thread once the encoder has exited.
+        # Each thread keeps its own count, so neither loses the other's
+        self.n_queue_full_stream_frames = 0
+        self.n_encoder_gone_stream_frames = 0
+        self.total_stream_latency = 0
+        self.max_stream_latency = 0
+
+    def open_stream_pipe(self):
+        fps = self.scene.camera.frame_rate
+        width, height = self.scene.camera.get_pixel_shape()
+        input_args, filter_args = self.get_raw_video_args()
+        stream_format = self.stream_format
+        if stream_format is None:
+            is_rtmp = self.stream_url.startswith(("rtmp://", "rtmps://"))
+            stream_format = "flv" if is_rtmp else "mpegts"
+        command = [
+            FFMPEG_BIN,
+            '-f', 'rawvideo',
+            '-s', f'{width}x{height}',  # size of one frame
+            *input_args,
+            '-r', str(fps),  # frames per second
+            '-i', '-',  # The imput comes from a pipe
+            *filter_args,
+            '-an',  # Tells FFMPEG not to expect any audio
+            '-loglevel', 'error',
+            '-vcodec', 'libx264',
+            '-pix_fmt', 'yuv420p',
+            # Encode each frame as soon as it arrives, with frequent
+            # keyframes so that viewers can join quickly
+            '-preset', 'ultrafast',
+            '-tune', 'zerolatency',
+            '-g', str(self.stream_keyframe_interval),
+            '-f', stream_format,
+            self.stream_url,
+        ]
+        self.stream_process = sp.Popen(command, stdin=sp.PIPE)
+        self.stream_thread = threading.Thread(
+            target=self.send_stream_frames, daemon=True
+        )
+        self.stream_thread.start()
+        self.stream_start_time = time.time()
+        self.n_stream_frames = 0
+
+    def write_stream_frame(self, frame_bytes):
+        # Hold frames back until they are due, so that the
+        # stream plays in real time however fast frames render
+        fps = self.scene.camera.frame_rate
+        delay = self.stream_start_time + self.n_stream_frames / fps - time.time()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            # Rendering fell behind, so keep pace from here on
+            # rather than sending what's late in a burst
+            self.stream_start_time -= delay
+        self.n_stream_frames += 1
+        try:
+            self.stream_queue.put_nowait((frame_bytes, time.time()))
+        except queue.Full:
+            self.n_queue_full_stream_frames += 1
+
+    def send_stream_frames(self):
+        # Runs on its own thread, feeding frames to the encoder
+        while True:
+            item = self.stream_queue.get()
+            if item is None:
+                return
+            frame_bytes, queue_time = item
+            try:
+                self.stream_process.stdin.write(frame_bytes)
+            except OSError:
+                # The encoder exited, e.g. on losing its connection,
+                # so frames from here on are dropped
+                self.n_encoder_gone_stream_frames += 1
+                continue
+            latency = time.time() - queue_time
+            self.n_sent_stream_frames += 1
+            self.total_stream_latency += latency
+            self.max_stream_latency = max(self.max_stream_latency, latency)
+
+    def get_stream_stats(self):
+        n_sent = self.n_sent_stream_frames
+        return {
+            "frames_sent": n_sent,
+            "frames_dropped": sum([
+                self.n_queue_full_stream_frames,
+                self.n_encoder_gone_stream_frames,
+            ]),
+            "mean_latency": self.total_stream_latency / n_sent if n_sent else 0,
+            "max_latency": self.max_stream_latency,
+        }
+
+    def finish_streaming(self):
+        if self.stream_process is None:
+            return
+        self.stream_queue.put(None)
+        self.stream_thread.join()
+        try:
+            self.stream_process.stdin.close()
+        except OSError:
+            pass
+        self.stream_process.wait()
+        self.stream_process = None
+        stats = self.get_stream_stats()
+        print(
+            "\nStreamed {frames_sent} frames to {url}, dropped {frames_dropped}, "
+            "latency {mean_ms:.1f}ms on average, {max_ms:.1f}ms at most\n".format(
+                url=self.stream_url,
+                mean_ms=1000 * stats["mean_latency"],
+                max_ms=1000 * stats["max_latency"],
+                **stats,
+            )
+        )
+
+    # Checkpoints
+    def get_source_hash(self):
+        if not os.path.isfile(self.input_file_path):
+            return None
+        with open(self.input_file_path, "rb") as fp:
+            return hashlib.sha256(fp.read()).hexdigest()
+
+    def is_saving_checkpoints(self):
+        return all([
+            self.write_to_movie,
+            not self.render_shard,
+            self.scene.save_checkpoints,
+        ])
+
+    def save_checkpoint(self, scene_state):
+        if not self.is_saving_checkpoints():
+            return
+        checkpoint = {
+            **scene_state,
+            "source_hash": self.get_source_hash(),
+            "partial_movie_files": self.written_partial_movie_files,
+            "audio_log_size": self.audio_log_size,
+        }
+        # Written aside and then moved into place, so that a crash
+        # midway through leaves the last checkpoint intact
+        file_path = self.get_checkpoint_path()
+        temp_file_path = file_path + ".temp"
+        with open(temp_file_path, "wb") as fp:
+            pickle.dump(checkpoint, fp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file_path, file_path)
+
+    def load_checkpoint(self):
+        """
+        Returns the last checkpoint saved while rendering this scene,
+        restoring the sound and partial movie files written up to it,
+        or None if there's no checkpoint which can be resumed from
+        """
+        if not self.write_to_movie:
+            return None
+        file_path = self.get_checkpoint_path()
+        if not os.path.exists(file_path):
+            print("No checkpoint to resume from, rendering from the start")
+            return None
+        with open(file_path, "rb") as fp:
+            checkpoint = pickle.load(fp)
+        if checkpoint["source_hash"] != self.get_source_hash():
+            print(
+                f"{self.input_file_path} has changed since the last "
+                "checkpoint, rendering from the start"
+            )
+            return None
+        required_files = list(checkpoint["partial_movie_files"])
+        if checkpoint["audio_log_size"] > 0:
+            required_files.append(self.get_audio_log_path())
+        if not all(map(os.path.exists, required_files)):
+            print(
+                "Files written before the checkpoint are missing, "
+                "rendering from the start"
+            )
+            return None
+        self.written_partial_movie_files = list(checkpoint["partial_movie_files"])
+        if checkpoint["audio_log_size"] > 0:
+            self.load_audio_log(checkpoint["audio_log_size"])
+        print(f"Resuming from animation {checkpoint['num_plays']}")
+        return checkpoint
 
     def save_final_image(self, image):
         file_path = self.get_image_file_path()
@@ -182,10 +637,23 @@ class SceneFileWriter(object):
         self.print_file_ready_message(file_path)
 
     def finish(self):
+        if self.save_pngs:
+            self.finish_png_writing()
+        if self.save_raw_frames:
+            self.finish_raw_frame_writing()
+        if self.stream_url is not None:
+            self.finish_streaming()
+        if self.render_shard:
+            # The shard is stitched together with the
+            # others by the process which spawned it
+            return
         if self.write_to_movie:
             if hasattr(self, "writing_process"):
                 self.writing_process.terminate()
             self.combine_movie_files()
+            for file_path in [self.get_checkpoint_path(), self.get_audio_log_path()]:
+                if os.path.exists(file_path):
+                    os.remove(file_path)
         if self.save_last_frame:
             self.scene.update_frame(ignore_skipping=True)
             self.save_final_image(self.scene.get_image())
@@ -202,16 +670,17 @@ class SceneFileWriter(object):
 
         fps = self.scene.camera.frame_rate
         width, height = self.scene.camera.get_pixel_shape()
+        input_args, filter_args = self.get_raw_video_args()
 
         command = [
             FFMPEG_BIN,
             '-y',  # overwrite output file if it exists
             '-f', 'rawvideo',
             '-s', f'{width}x{height}',  # size of one frame
-            '-pix_fmt', 'rgba',
+            *input_args,
             '-r', str(fps),  # frames per second
             '-i', '-',  # The imput comes from a pipe
-            '-vf', 'vflip',
+            *filter_args,
             '-an',  # Tells FFMPEG not to expect any audio
             '-loglevel', 'error',
         ]
@@ -231,6 +700,20 @@ class SceneFileWriter(object):
         command += [temp_file_path]
         self.writing_process = sp.Popen(command, stdin=sp.PIPE)
 
+    def get_raw_video_args(self):
+        width, height = self.scene.camera.get_pixel_shape()
+        self.use_gpu_yuv420 = all([
+            self.gpu_yuv420,
+            self.movie_file_extension != ".mov",
+            width % 2 == 0,
+            height % 2 == 0,
+        ])
+        # Frames converted on the gpu come already flipped
+        if self.use_gpu_yuv420:
+            return ['-pix_fmt', 'yuv420p'], []
+        else:
+            return ['-pix_fmt', 'rgba'], ['-vf', 'vflip']
+
     def close_movie_pipe(self):
         self.writing_process.stdin.close()
         self.writing_process.wait()
@@ -238,6 +721,42 @@ class SceneFileWriter(object):
             self.temp_partial_movie_file_path,
             self.partial_movie_file_path,
         )
+        self.written_partial_movie_files.append(self.partial_movie_file_path)
+
+    def stitch_shards(self, animation_number, shard_paths):
+        # Shards are encoded independently with identical settings,
+        # so they can be concatenated without re-encoding
+        file_list = os.path.join(
+            self.shard_directory,
+            f"{animation_number:05}_shard_list.txt"
+        )
+        with open(file_list, 'w') as fp:
+            for shard_path in shard_paths:
+                if os.name == 'nt':
+                    shard_path = shard_path.replace('\\', '/')
+                fp.write("file \'{}\'\n".format(shard_path))
+        movie_file_path = self.get_partial_movie_path(animation_number)
+        commands = [
+            FFMPEG_BIN,
+            '-y',  # overwrite output file if it exists
+            '-f', 'concat',
+            '-safe', '0',
+            '-i', file_list,
+            '-loglevel', 'error',
+            '-c', 'copy',
+            movie_file_path,
+        ]
+        if sp.call(commands) != 0:
+            # The shards are kept, but not whatever part of the
+            # movie was written, as it would pass for a whole one
+            if os.path.exists(movie_file_path):
+                os.remove(movie_file_path)
+            raise Exception(
+                f"Stitching the shards of animation {animation_number} failed, "
+                f"they're left in {self.shard_directory}"
+            )
+        for path in [file_list, *shard_paths]:
+            os.remove(path)
 
     def combine_movie_files(self):
         # Manim renders the scene as many smaller movie files
@@ -284,48 +803,74 @@ class SceneFileWriter(object):
             '-f', 'concat',
             '-safe', '0',
             '-i', file_list,
-            '-loglevel', 'error',
-            '-c', 'copy',
-            movie_file_path
         ]
-        if not self.includes_sound:
-            commands.insert(-1, '-an')
-
-        combine_process = sp.Popen(commands)
-        combine_process.wait()
-
+        audio_data = None
         if self.includes_sound:
-            sound_file_path = movie_file_path.replace(
-                self.movie_file_extension, ".wav"
-            )
+            from pydub import AudioSegment
             # Makes sure sound file length will match video file
-            self.add_audio_segment(AudioSegment.silent(0))
-            self.audio_segment.export(
-                sound_file_path,
-                bitrate='312k',
-            )
-            temp_file_path = movie_file_path.replace(".", "_temp.")
-            commands = [
-                "ffmpeg",
-                "-i", movie_file_path,
-                "-i", sound_file_path,
-                '-y',  # overwrite output file if it exists
-                "-c:v", "copy",
-                "-c:a", "aac",
-                "-b:a", "320k",
-                # select video stream from first file
+            self.mix_audio_segment(AudioSegment.silent(0))
+            segment = self.audio_segment
+            # The audio is piped in as raw samples, to be muxed in the
+            # same pass which concatenates the partial movie files
+            audio_data = segment.raw_data
+            commands += [
+                '-f', PCM_SAMPLE_WIDTH_TO_FORMAT[segment.sample_width],
+                '-ar', str(segment.frame_rate),
+                '-ac', str(segment.channels),
+                '-i', '-',
+                # select video stream from the partial movie files
                 "-map", "0:v:0",
-                # select audio stream from second file
+                # select audio stream from the pipe
                 "-map", "1:a:0",
-                '-loglevel', 'error',
-                # "-shortest",
-                temp_file_path,
+                "-c:a", "aac",
+                "-b:a", "320k",
             ]
+        else:
+            commands += ['-an']
+        commands += [
+            '-loglevel', 'error',
+            '-c:v', 'copy',
+            movie_file_path
+        ]
+        if audio_data is None:
             sp.call(commands)
-            shutil.move(temp_file_path, movie_file_path)
-            os.remove(sound_file_path)
+        else:
+            combine_process = sp.Popen(commands, stdin=sp.PIPE)
+            combine_process.communicate(audio_data)
 
         self.print_file_ready_message(movie_file_path)
+        if self.save_as_gif:
+            self.write_gif()
+
+    def write_gif(self):
+        # Two passes over the movie, the first finding a palette for the
+        # whole of it and the second mapping frames onto that palette,
+        # so that no more than a frame is held in memory at a time
+        movie_file_path = self.get_movie_file_path()
+        palette_file_path = os.path.splitext(self.gif_file_path)[0] + "_palette.png"
+        filters = ",".join([
+            f"fps={self.gif_frame_rate}",
+            f"scale={self.gif_pixel_width}:-2:flags=lanczos",
+        ])
+        sp.call([
+            FFMPEG_BIN,
+            '-y',  # overwrite output file if it exists
+            '-i', movie_file_path,
+            '-vf', filters + ",palettegen",
+            '-loglevel', 'error',
+            palette_file_path,
+        ])
+        sp.call([
+            FFMPEG_BIN,
+            '-y',  # overwrite output file if it exists
+            '-i', movie_file_path,
+            '-i', palette_file_path,
+            '-lavfi', filters + "[x];[x][1:v]paletteuse",
+            '-loglevel', 'error',
+            self.gif_file_path,
+        ])
+        os.remove(palette_file_path)
+        self.print_file_ready_message(self.gif_file_path)
 
     def print_file_ready_message(self, file_path):
         print("\nFile ready at {}\n".format(file_path))
@@ -346,7 +891,9 @@ class SceneFileWriter(object):
 
         if self.save_last_frame:
             file_paths.append(self.get_image_file_path())
-        if self.write_to_movie:
+        if self.save_as_gif:
+            file_paths.append(self.gif_file_path)
+        elif self.write_to_movie:
             file_paths.append(self.get_movie_file_path())
 
         for file_path in file_paths:
@@ -1,5 +1,4 @@
 from tqdm import tqdm as show_progress
-import cv2
 
 from manimlib.scene.scene import Scene
 
@@ -9,6 +8,7 @@ class SceneFromVideo(Scene):
     def construct(self, file_name,
                   freeze_last_frame=True,
                   time_range=None):
+        import cv2
         cap = cv2.VideoCapture(file_name)
         self.shape = (
             int(cap.get(cv2.cv.CV_CAP_PROP_FRAME_HEIGHT)),
@@ -38,12 +38,14 @@ class SceneFromVideo(Scene):
             self.original_background = self.background = self.frames[-1]
 
     def apply_gaussian_blur(self, ksize=(5, 5), sigmaX=5):
+        import cv2
         self.frames = [
             cv2.GaussianBlur(frame, ksize, sigmaX)
             for frame in self.frames
         ]
 
     def apply_edge_detection(self, threshold1=50, threshold2=100):
+        import cv2
         edged_frames = [
             cv2.Canny(frame, threshold1, threshold2)
             for frame in self.frames
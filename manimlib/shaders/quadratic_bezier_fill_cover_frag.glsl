@@ -0,0 +1,28 @@
+#version 330
+
+// Colors each pixel in proportion to how many of its samples
+// in the winding texture are inside the path, by the nonzero rule
+
+uniform sampler2D Winding;
+uniform int supersampling;
+// Pixel of the frame buffer at the corner of the winding texture
+uniform ivec2 winding_origin;
+
+in vec4 v_color;
+
+out vec4 frag_color;
+
+
+void main() {
+    ivec2 corner = supersampling * (ivec2(gl_FragCoord.xy) - winding_origin);
+    float n_inside = 0;
+    for(int i = 0; i < supersampling; i++){
+        for(int j = 0; j < supersampling; j++){
+            float winding = texelFetch(Winding, corner + ivec2(i, j), 0).r;
+            if(abs(winding) > 0.5) n_inside++;
+        }
+    }
+    if(n_inside == 0) discard;
+    frag_color = v_color;
+    frag_color.a *= n_inside / float(supersampling * supersampling);
+}
@@ -0,0 +1,19 @@
+#version 330
+
+uniform float scale;
+uniform float aspect_ratio;
+uniform vec3 frame_center;
+
+in vec3 point;
+in vec4 color;
+
+out vec4 v_color;
+
+
+#INSERT scale_and_shift_point_for_frame.glsl
+
+
+void main(){
+    v_color = color;
+    gl_Position = vec4(scale_and_shift_point_for_frame(point), 1.0);
+}
@@ -0,0 +1,30 @@
+#version 330
+
+in vec3 point;
+in vec4 color;
+// fill_all is 0 or 1
+in float fill_all;
+// orientation is +1 for counterclockwise curves, -1 otherwise
+in float orientation;
+
+// Per instance
+in mat3 instance_matrix;
+in vec3 instance_shift;
+in vec4 instance_color;
+
+out vec3 bp;  // Bezier control point
+out vec4 v_color;
+out float v_fill_all;
+out float v_orientation;
+
+
+#INSERT rotate_point_for_frame.glsl
+
+
+void main(){
+    bp = rotate_point_for_frame(instance_matrix * point + instance_shift);
+    v_color = color * instance_color;
+    v_fill_all = fill_all;
+    // Reflections reverse the orientation of curves
+    v_orientation = orientation * sign(determinant(instance_matrix));
+}
\ No newline at end of file
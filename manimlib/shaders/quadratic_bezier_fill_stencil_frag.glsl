@@ -0,0 +1,16 @@
+#version 330
+
+// Drawn with additive blending into a single channel float
+// texture, which ends up holding the winding number of the
+// path around each point.  See Camera.render_stencil_fill
+
+in vec2 v_curve_coords;
+
+out vec4 frag_color;
+
+
+void main() {
+    // Outside the region between a curve and its chord
+    if(v_curve_coords.x * v_curve_coords.x > v_curve_coords.y) discard;
+    frag_color = vec4(gl_FrontFacing ? 1.0 : -1.0, 0.0, 0.0, 0.0);
+}
@@ -0,0 +1,27 @@
+#version 330
+
+uniform float scale;
+uniform float aspect_ratio;
+uniform vec3 frame_center;
+// Part of the frame, as (x0, y0, x1, y1) in clip space,
+// which the winding texture covers
+uniform vec4 winding_box;
+
+in vec3 point;
+in vec2 curve_coords;
+
+out vec2 v_curve_coords;
+
+
+#INSERT rotate_point_for_frame.glsl
+#INSERT scale_and_shift_point_for_frame.glsl
+
+
+void main(){
+    v_curve_coords = curve_coords;
+    vec3 clip_point = scale_and_shift_point_for_frame(rotate_point_for_frame(point));
+    vec2 box_center = 0.5 * (winding_box.xy + winding_box.zw);
+    vec2 box_size = winding_box.zw - winding_box.xy;
+    clip_point.xy = 2.0 * (clip_point.xy - box_center) / box_size;
+    gl_Position = vec4(clip_point, 1.0);
+}
@@ -0,0 +1,44 @@
+#version 330
+
+in vec3 point;
+in vec3 prev_point;
+in vec3 next_point;
+
+in float stroke_width;
+in vec4 color;
+in float joint_type;
+
+// Per instance
+in mat3 instance_matrix;
+in vec3 instance_shift;
+in vec4 instance_color;
+
+out vec3 bp;  // Bezier control point
+out vec3 prev_bp;
+out vec3 next_bp;
+
+out float v_stroke_width;
+out vec4 v_color;
+out float v_joint_type;
+
+// TODO, this should maybe depend on scale
+const float STROKE_WIDTH_CONVERSION = 0.01;
+
+
+#INSERT rotate_point_for_frame.glsl
+
+
+vec3 place_instance(vec3 p){
+    return instance_matrix * p + instance_shift;
+}
+
+
+void main(){
+    v_stroke_width = STROKE_WIDTH_CONVERSION * stroke_width;
+    v_color = color * instance_color;
+    v_joint_type = joint_type;
+
+    bp = rotate_point_for_frame(place_instance(point));
+    prev_bp = rotate_point_for_frame(place_instance(prev_point));
+    next_bp = rotate_point_for_frame(place_instance(next_point));
+}
\ No newline at end of file
@@ -0,0 +1,56 @@
+#version 330
+
+// For strokes tessellated on the cpu, see manimlib/utils/stroke_tessellation.py,
+// which computes what quadratic_bezier_stroke_geom.glsl would emit
+
+uniform float scale;
+uniform float aspect_ratio;
+uniform vec3 frame_center;
+
+in vec3 point;
+in vec4 v_color;
+in vec2 v_uv_coords;
+in vec2 v_uv_b2;
+in float v_uv_stroke_width;
+in float v_uv_anti_alias_width;
+in float v_has_prev;
+in float v_has_next;
+in float v_bevel_start;
+in float v_bevel_end;
+in float v_angle_from_prev;
+in float v_angle_to_next;
+in float v_bezier_degree;
+
+out vec4 color;
+out vec2 uv_coords;
+out vec2 uv_b2;
+out float uv_stroke_width;
+out float uv_anti_alias_width;
+out float has_prev;
+out float has_next;
+out float bevel_start;
+out float bevel_end;
+out float angle_from_prev;
+out float angle_to_next;
+out float bezier_degree;
+
+
+#INSERT scale_and_shift_point_for_frame.glsl
+
+
+void main(){
+    color = v_color;
+    uv_coords = v_uv_coords;
+    uv_b2 = v_uv_b2;
+    uv_stroke_width = v_uv_stroke_width;
+    uv_anti_alias_width = v_uv_anti_alias_width;
+    has_prev = v_has_prev;
+    has_next = v_has_next;
+    bevel_start = v_bevel_start;
+    bevel_end = v_bevel_end;
+    angle_from_prev = v_angle_from_prev;
+    angle_to_next = v_angle_to_next;
+    bezier_degree = v_bezier_degree;
+
+    gl_Position = vec4(scale_and_shift_point_for_frame(point), 1.0);
+}
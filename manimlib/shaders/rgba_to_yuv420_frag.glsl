@@ -0,0 +1,49 @@
+#version 330
+
+uniform sampler2D Texture;
+// Width and height of the rgba image in Texture,
+// both assumed to be even
+uniform ivec2 pixel_shape;
+
+out float frag_value;
+
+// Rows of the output, read back bottom first, hold the Y plane
+// followed by the U and V planes, each byte of which is computed
+// by one fragment.  Texture rows run bottom to top, so each plane
+// comes out flipped, i.e. top row first.
+
+// BT.601 with limited range, matching ffmpeg's default
+const vec3 Y_COEFS = vec3(65.481, 128.553, 24.966);
+const vec3 U_COEFS = vec3(-37.797, -74.203, 112.0);
+const vec3 V_COEFS = vec3(112.0, -93.786, -18.214);
+
+vec3 get_rgb(int col, int row){
+    return texelFetch(Texture, ivec2(col, pixel_shape.y - 1 - row), 0).rgb;
+}
+
+void main() {
+    int w = pixel_shape.x;
+    int h = pixel_shape.y;
+    int index = int(gl_FragCoord.y) * w + int(gl_FragCoord.x);
+    int y_size = w * h;
+    int c_width = w / 2;
+    int c_size = c_width * (h / 2);
+
+    if(index < y_size){
+        vec3 rgb = get_rgb(index % w, index / w);
+        frag_value = (16.0 + dot(Y_COEFS, rgb)) / 255.0;
+        return;
+    }
+
+    int c_index = index - y_size;
+    bool is_v = (c_index >= c_size);
+    if(is_v) c_index -= c_size;
+    int col = 2 * (c_index % c_width);
+    int row = 2 * (c_index / c_width);
+    // Average over the 2x2 block of pixels sharing this sample
+    vec3 rgb = 0.25 * (
+        get_rgb(col, row) + get_rgb(col + 1, row) +
+        get_rgb(col, row + 1) + get_rgb(col + 1, row + 1)
+    );
+    frag_value = (128.0 + dot(is_v ? V_COEFS : U_COEFS, rgb)) / 255.0;
+}
@@ -0,0 +1,113 @@
+import subprocess as sp
+import sys
+
+import numpy as np
+
+from manimlib.extract_scene import get_scene_kwargs
+
+# Flags and options passed on as is to the processes rendering shards
+SHARD_FLAGS = [
+    "low_quality",
+    "medium_quality",
+    "high_quality",
+    "transparent",
+    "gpu_yuv",
+    "leave_progress_bars",
+]
+SHARD_OPTIONS = [
+    "resolution",
+    "color",
+    "file_name",
+    "media_dir",
+    "video_dir",
+    "video_output_dir",
+    "tex_dir",
+]
+
+
+def get_animation_frame_counts(scene_class, config):
+    # Run through the scene without drawing anything to find
+    # how many frames each of its plays and waits spans
+    kwargs = get_scene_kwargs(config)
+    kwargs.update({
+        "skip_animations": True,
+        "start_at_animation_number": None,
+        "end_at_animation_number": config["end_at_animation_number"],
+        "preview": False,
+        "file_writer_config": {
+            **config["file_writer_config"],
+            "write_to_movie": False,
+            "save_last_frame": False,
+            "open_file_upon_completion": False,
+            "show_file_location_upon_completion": False,
+        },
+    })
+    scene = scene_class(**kwargs)
+    scene.run()
+    counts = scene.animation_frame_counts
+    start = config["start_at_animation_number"] or 0
+    return dict([
+        (index, count)
+        for index, count in counts.items()
+        if index >= start
+    ])
+
+
+def get_shard_command(args, scene_name, animation_number, start, end):
+    command = [
+        sys.executable, "-c", "import manimlib; manimlib.main()",
+        args.file, scene_name,
+        "--write_file",
+        "-n", str(animation_number),
+        "--frames", f"{start},{end}",
+    ]
+    for flag in SHARD_FLAGS:
+        if getattr(args, flag):
+            command.append("--" + flag)
+    for option in SHARD_OPTIONS:
+        value = getattr(args, option)
+        if value is not None:
+            command += ["--" + option, value]
+    return command
+
+
+def render_in_shards(scene, args, config):
+    """
+    Renders the longest animation of scene across config["n_shards"]
+    processes, each writing a range of its frames, and stitches those
+    together into its partial movie file.  The scene is then run as
+    usual, except that it only updates through that animation.
+    """
+    file_writer = scene.file_writer
+    counts = get_animation_frame_counts(scene.__class__, config)
+    if not file_writer.write_to_movie or len(counts) == 0:
+        scene.run()
+        return
+
+    animation_number = max(counts, key=lambda index: counts[index])
+    bounds = np.linspace(
+        0, counts[animation_number], config["n_shards"] + 1
+    ).astype(int)
+    ranges = [
+        (start, end)
+        for start, end in zip(bounds[:-1], bounds[1:])
+        if start < end
+    ]
+    processes = [
+        sp.Popen(get_shard_command(
+            args, scene.__class__.__name__, animation_number, start, end
+        ))
+        for start, end in ranges
+    ]
+    return_codes = [process.wait() for process in processes]
+    if any(return_codes):
+        raise Exception(
+            f"Rendering shards of animation {animation_number} failed"
+        )
+    file_writer.stitch_shards(animation_number, [
+        file_writer.get_shard_movie_path(animation_number, start)
+        for start, end in ranges
+    ])
+
+    scene.animation_frame_ranges[animation_number] = (0, 0)
+    scene.run()
@@ -1,4 +1,3 @@
-from scipy import linalg
 import numpy as np
 
 from manimlib.utils.simple_functions import choose
@@ -85,6 +84,9 @@ def match_interpolate(new_start, new_end, old_start, old_end, old_value):
 
 
 def get_smooth_handle_points(points):
+    # Imported here, as scipy is slow to import and rarely needed
+    from scipy import linalg
+
     points = np.array(points)
     num_handles = len(points) - 1
     dim = points.shape[1]
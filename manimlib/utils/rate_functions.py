@@ -2,55 +2,74 @@ import numpy as np
 
 from manimlib.utils.bezier import bezier
 from manimlib.utils.simple_functions import sigmoid
-from manimlib.utils.simple_functions import clip
+from manimlib.utils.simple_functions import is_vectorized
+from manimlib.utils.simple_functions import vectorized
 
+# All rate functions here accept either a number or a numpy
+# array of numbers, and are marked as such with @vectorized.
+# Piecewise definitions use np.where, and index with [()] so
+# that a number input still gives a number output.
 
+
+@vectorized
 def linear(t):
     return t
 
 
+@vectorized
 def smooth(t, inflection=10.0):
     error = sigmoid(-inflection / 2)
-    return clip(
+    return np.clip(
         (sigmoid(inflection * (t - 0.5)) - error) / (1 - 2 * error),
         0, 1,
     )
 
 
+@vectorized
 def rush_into(t, inflection=10.0):
     return 2 * smooth(t / 2.0, inflection)
 
 
+@vectorized
 def rush_from(t, inflection=10.0):
     return 2 * smooth(t / 2.0 + 0.5, inflection) - 1
 
 
+@vectorized
 def slow_into(t):
     return np.sqrt(1 - (1 - t) * (1 - t))
 
 
+@vectorized
 def double_smooth(t):
-    if t < 0.5:
-        return 0.5 * smooth(2 * t)
-    else:
-        return 0.5 * (1 + smooth(2 * t - 1))
+    return np.where(
+        t < 0.5,
+        0.5 * smooth(2 * t),
+        0.5 * (1 + smooth(2 * t - 1)),
+    )[()]
 
 
+@vectorized
 def there_and_back(t, inflection=10.0):
-    new_t = 2 * t if t < 0.5 else 2 * (1 - t)
+    new_t = np.where(t < 0.5, 2 * t, 2 * (1 - t))[()]
     return smooth(new_t, inflection)
 
 
+@vectorized
 def there_and_back_with_pause(t, pause_ratio=1. / 3):
     a = 1. / pause_ratio
-    if t < 0.5 - pause_ratio / 2:
-        return smooth(a * t)
-    elif t < 0.5 + pause_ratio / 2:
-        return 1
-    else:
-        return smooth(a - a * t)
-
-
+    return np.where(
+        t < 0.5 - pause_ratio / 2,
+        smooth(a * t),
+        np.where(
+            t < 0.5 + pause_ratio / 2,
+            1,
+            smooth(a - a * t),
+        )
+    )[()]
+
+
+@vectorized
 def running_start(t, pull_factor=-0.5):
     return bezier([0, 0, pull_factor, pull_factor, 1, 1, 1])(t)
 
@@ -58,9 +77,12 @@ def running_start(t, pull_factor=-0.5):
 def not_quite_there(func=smooth, proportion=0.7):
     def result(t):
         return proportion * func(t)
+    if is_vectorized(func):
+        return vectorized(result)
     return result
 
 
+@vectorized
 def wiggle(t, wiggles=2):
     return there_and_back(t) * np.sin(wiggles * np.pi * t)
 
@@ -68,15 +90,13 @@ def wiggle(t, wiggles=2):
 def squish_rate_func(func, a=0.4, b=0.6):
     def result(t):
         if a == b:
-            return a
-
-        if t < a:
-            return func(0)
-        elif t > b:
-            return func(1)
-        else:
-            return func((t - a) / (b - a))
+            return np.full(np.shape(t), a)[()]
+        # Inputs below a and above b are clipped to
+        # give func(0) and func(1) respectively
+        return func(np.clip((t - a) / (b - a), 0, 1))
 
+    if is_vectorized(func):
+        return vectorized(result)
     return result
 
 # Stylistically, should this take parameters (with default values)?
@@ -85,11 +105,29 @@ def squish_rate_func(func, a=0.4, b=0.6):
 # "lingering", different from squish_rate_func's default params
 
 
+@vectorized
 def lingering(t):
     return squish_rate_func(lambda t: t, 0, 0.8)(t)
 
 
+@vectorized
 def exponential_decay(t, half_life=0.1):
     # The half-life should be rather small to minimize
     # the cut-off error at the end
     return 1 - np.exp(-t / half_life)
+
+
+def lookup_table_rate_func(func, n_samples=1025):
+    """
+    Returns an approximation to the rate function func, for
+    inputs between 0 and 1, which linearly interpolates between
+    its values at n_samples evenly spaced points.  Useful when
+    func is expensive and gets evaluated on many alphas.
+    """
+    samples = np.linspace(0, 1, n_samples)
+    values = np.array([func(t) for t in samples])
+
+    @vectorized
+    def result(t):
+        return np.interp(t, samples, values)
+    return result
@@ -1,25 +1,87 @@
 import os
 import warnings
 import re
+import threading
 import moderngl
 
+from collections import namedtuple
+
 from manimlib.constants import SHADER_DIR
 
 # Mobjects that should be rendered with
 # the same shader will be organized and
 # clumped together based on keeping track
-# of a dict holding all the relevant information
-# to that shader
+# of a ShaderInfo holding all the relevant
+# information to that shader
 
 
-SHADER_INFO_KEYS = [
-    "data",
+# Everything about a shader besides the data it draws,
+# namely the files holding its code, its texture, and
+# the render primative
+ShaderDescriptor = namedtuple("ShaderDescriptor", [
+    "id",
     "vert",
     "geom",
     "frag",
     "texture_path",
     "render_primative",
-]
+])
+
+# The data to draw with an interned shader descriptor, along with
+# arrays which some shader infos carry besides, used by the camera
+# when drawing them.  Stencil fills also carry a function returning
+# the shader info of the same fill triangulated, which the camera
+# draws instead when the fill is too big for its winding texture
+ShaderInfo = namedtuple("ShaderInfo", [
+    "descriptor",
+    "data",
+    "instance_data",
+    "fill_rgba",
+    "fill_fallback",
+], defaults=[None, None, None, None])
+
+
+# Each distinct combination of shader files, texture and
+# render primative is interned once as a descriptor with a
+# small integer id.  Descriptors are looked up by the arguments
+# they were asked for with, as well as by their normalized form.
+SHADER_KEY_TO_DESCRIPTOR = {}
+SHADER_ID_TO_DESCRIPTOR = []
+# Shader infos may be built on several threads at once
+SHADER_ID_LOCK = threading.Lock()
+
+
+def get_shader_descriptor(vert_file=None,
+                          geom_file=None,
+                          frag_file=None,
+                          texture_path=None,
+                          render_primative=moderngl.TRIANGLE_STRIP):
+    key = (vert_file, geom_file, frag_file, texture_path, render_primative)
+    descriptor = SHADER_KEY_TO_DESCRIPTOR.get(key)
+    if descriptor is None:
+        with SHADER_ID_LOCK:
+            normalized_key = (
+                vert_file or None,
+                geom_file or None,
+                frag_file or None,
+                texture_path or None,
+                int(render_primative),
+            )
+            descriptor = SHADER_KEY_TO_DESCRIPTOR.get(normalized_key)
+            if descriptor is None:
+                descriptor = ShaderDescriptor(len(SHADER_ID_TO_DESCRIPTOR), *normalized_key)
+                SHADER_ID_TO_DESCRIPTOR.append(descriptor)
+                SHADER_KEY_TO_DESCRIPTOR[normalized_key] = descriptor
+            SHADER_KEY_TO_DESCRIPTOR[key] = descriptor
+    return descriptor
+
+
+def get_shader_id(*args, **kwargs):
+    return get_shader_descriptor(*args, **kwargs).id
+
+
+def shader_id_to_descriptor(sid):
+    return SHADER_ID_TO_DESCRIPTOR[sid]
 
 
 def get_shader_info(data=None,
@@ -28,57 +90,47 @@ def get_shader_info(data=None,
                     frag_file=None,
                     texture_path=None,
                     render_primative=moderngl.TRIANGLE_STRIP):
-    return {
-        key: value
-        for key, value in zip(
-            SHADER_INFO_KEYS,
-            [
-                data, vert_file, geom_file, frag_file,
-                texture_path, str(render_primative)
-            ]
-        )
-    }
+    descriptor = get_shader_descriptor(
+        vert_file, geom_file, frag_file,
+        texture_path, render_primative
+    )
+    return ShaderInfo(descriptor, data)
 
 
 def is_valid_shader_info(shader_info):
-    data = shader_info["data"]
+    data = shader_info.data
     return all([
         data is not None and len(data) > 0,
-        shader_info["vert"],
-        shader_info["frag"],
+        shader_info.descriptor.vert,
+        shader_info.descriptor.frag,
     ])
 
 
 def shader_info_to_id(shader_info):
     # A unique id for a shader based on the
     # files holding its code and texture
-    return "|".join([
-        shader_info.get(key, "") or ""
-        for key in SHADER_INFO_KEYS[1:]
-    ])
+    return shader_info.descriptor.id
+
+
+def shader_info_to_batch_key(shader_info):
+    # Shader infos with any of the extra arrays are each drawn
+    # on their own, rather than having their data joined with others
+    if shader_info.instance_data is not None or shader_info.fill_rgba is not None:
+        return (shader_info.descriptor.id, id(shader_info))
+    return shader_info.descriptor.id
 
 
-def shader_id_to_info(sid):
-    return {
-        key: (value or None)
-        for key, value in zip(
-            SHADER_INFO_KEYS,
-            [None, *sid.split("|")]
-        )
-    }
+def shader_id_to_info(sid, data=None):
+    return ShaderInfo(SHADER_ID_TO_DESCRIPTOR[sid], data)
 
 
 def same_shader_type(info1, info2):
-    return all([
-        info1[key] == info2[key]
-        for key in [
-            "vert",
-            "geom",
-            "frag",
-            "texture_path",
-            "render_primative",
-        ]
-    ])
+    return info1.descriptor is info2.descriptor
+
+
+# Resolved shader code, keyed by file path, along with the
+# modification times of all files it was built from
+SHADER_CODE_CACHE = {}
 
 
 def get_shader_code_from_file(filename):
@@ -90,6 +142,12 @@ def get_shader_code_from_file(filename):
         warnings.warn(f"No file at {filepath}")
         return
 
+    if filepath in SHADER_CODE_CACHE:
+        result, mtimes = SHADER_CODE_CACHE[filepath]
+        if all(os.path.getmtime(path) == mtime for path, mtime in mtimes):
+            return result
+
+    mtimes = [(filepath, os.path.getmtime(filepath))]
     with open(filepath, "r") as f:
         result = f.read()
 
@@ -99,6 +157,9 @@ def get_shader_code_from_file(filename):
     # Replace "#INSERT " lines with relevant code
     insertions = re.findall(r"^#INSERT .*\.glsl$", result, flags=re.MULTILINE)
     for line in insertions:
-        inserted_code = get_shader_code_from_file(line.replace("#INSERT ", ""))
+        inserted_filename = line.replace("#INSERT ", "")
+        inserted_code = get_shader_code_from_file(inserted_filename)
         result = result.replace(line, inserted_code)
+        mtimes += SHADER_CODE_CACHE[os.path.join(SHADER_DIR, inserted_filename)][1]
+    SHADER_CODE_CACHE[filepath] = (result, mtimes)
     return result
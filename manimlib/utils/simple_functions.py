@@ -38,6 +38,23 @@ def get_num_args(function):
 def get_parameters(function):
     return inspect.signature(function).parameters
 
+
+def vectorized(function):
+    """
+    Decorator marking a function as able to take in an array of
+    inputs and return the array of their outputs, e.g. a function
+    of points acting on an array with one point per row, or a
+    rate function acting on an array of alphas.  Methods like
+    Mobject.apply_function will then call it once on all inputs,
+    rather than once per input.
+    """
+    function.vectorized = True
+    return function
+
+
+def is_vectorized(function):
+    return getattr(function, "vectorized", False)
+
 # Just to have a less heavyweight name for this extremely common operation
 #
 # We may wish to have more fine-grained control over division by zero behavior
@@ -0,0 +1,317 @@
+import numpy as np
+
+# A vectorized port of quadratic_bezier_stroke_geom.glsl, for contexts
+# where geometry shaders are slow, e.g. llvmpipe.  Each curve becomes
+# the same 4 or 5 corners the geometry shader would emit, carrying the
+# same outputs, so that quadratic_bezier_stroke_frag.glsl can shade
+# them exactly as before.  Corner strips are written out as 3 triangles.
+
+# Should match the constants in the stroke shaders
+STROKE_WIDTH_CONVERSION = 0.01
+AUTO_JOINT = 0
+ROUND_JOINT = 1
+BEVEL_JOINT = 2
+MITER_JOINT = 3
+
+TESSELLATED_STROKE_DTYPE = [
+    ("point", np.float32, (3,)),
+    ("v_color", np.float32, (4,)),
+    ("v_uv_coords", np.float32, (2,)),
+    ("v_uv_b2", np.float32, (2,)),
+    ("v_uv_stroke_width", np.float32, (1,)),
+    ("v_uv_anti_alias_width", np.float32, (1,)),
+    ("v_has_prev", np.float32, (1,)),
+    ("v_has_next", np.float32, (1,)),
+    ("v_bevel_start", np.float32, (1,)),
+    ("v_bevel_end", np.float32, (1,)),
+    ("v_angle_from_prev", np.float32, (1,)),
+    ("v_angle_to_next", np.float32, (1,)),
+    ("v_bezier_degree", np.float32, (1,)),
+]
+
+# Triangles covering the strip of 5 corners.  With only
+# 4 corners, the fifth repeats the fourth, so the last
+# triangle is degenerate
+STRIP_TRIANGLE_INDICES = np.array([0, 1, 2, 1, 2, 3, 2, 3, 4])
+
+
+def cross2d(v, w):
+    return v[..., 0] * w[..., 1] - v[..., 1] * w[..., 0]
+
+
+def dot2d(v, w):
+    return (v * w).sum(-1)
+
+
+def norm2d(v):
+    return np.sqrt(dot2d(v, v))
+
+
+def normalize2d(v):
+    return v / norm2d(v)[..., np.newaxis]
+
+
+def perp2d(v):
+    return np.stack([-v[..., 1], v[..., 0]], -1)
+
+
+def where2d(cond, v, w):
+    return np.where(cond[..., np.newaxis], v, w)
+
+
+def get_reduced_control_points(b0, b1, b2):
+    # Returns degrees (0 for null curves, 1 for linear, 2 for
+    # quadratic) along with control points, where for linear
+    # curves the second control point is the end
+    epsilon = 1e-6
+    v01 = b1 - b0
+    v12 = b2 - b1
+    distinct_01 = norm2d(v01) > epsilon
+    distinct_12 = norm2d(v12) > epsilon
+    linear = dot2d(normalize2d(v01), normalize2d(v12)) > 1 - epsilon
+    degrees = distinct_01.astype(int) + distinct_12.astype(int)
+    degrees[(degrees == 2) & linear] = 1
+    controls = np.stack([b0, where2d(degrees == 2, b1, b2), b2], 1)
+    return degrees, controls
+
+
+def angle_between_vectors(v1, v2):
+    nv1 = normalize2d(v1)
+    nv2 = normalize2d(v2)
+    unsigned_angle = np.arccos(np.clip(dot2d(nv1, nv2), -1, 1))
+    return np.sign(cross2d(nv1, nv2)) * unsigned_angle
+
+
+def find_intersection(p0, v0, p1, v1):
+    # Intersection of the line through p0 in the direction v0 with
+    # that through p1 in the direction v1, or p0 if they're parallel
+    det = cross2d(v1, v0)
+    safe_det = np.where(det == 0, 1, det)
+    t = np.where(det == 0, 0, cross2d(p0 - p1, v1) / safe_det)
+    return p0 + v0 * t[..., np.newaxis]
+
+
+def is_between(p, a, b):
+    # Assumes three points fall on a line
+    d_pa = norm2d(p - a)
+    d_pb = norm2d(p - b)
+    d_ab = norm2d(a - b)
+    return (d_ab >= d_pa) & (d_ab >= d_pb)
+
+
+def should_modify_corner(c, from_c, o1, o2, from_o, buff):
+    int1 = find_intersection(c, from_c, o1, from_o)
+    int2 = find_intersection(c, from_c, o2, from_o)
+    return ~is_between(int2, c + from_c * buff[..., np.newaxis], int1)
+
+
+def get_adjacent_info(point, tangent, degrees, joint_types, adj, is_prev):
+    adj_degrees, adj_controls = get_reduced_control_points(*adj)
+    has = adj_degrees > 0
+    n = len(adj_degrees)
+    if is_prev:
+        adj_point = adj_controls[np.arange(n), np.maximum(adj_degrees - 1, 0)]
+        angle = angle_between_vectors(point - adj_point, tangent)
+    else:
+        adj_point = adj_controls[:, 1]
+        angle = -angle_between_vectors(point - adj_point, tangent)
+    angle = np.where(has, angle, 0)
+    one_linear = (degrees == 1) | (adj_degrees == 1)
+    should_bevel = (
+        ((joint_types == AUTO_JOINT) & one_linear) |
+        (joint_types == BEVEL_JOINT)
+    )
+    return has, should_bevel, angle
+
+
+def get_joint_shift(angle, buff, should_bevel, joint_types):
+    miter = (
+        ((joint_types == AUTO_JOINT) & (np.abs(angle) > 2.8) & (should_bevel == 1)) |
+        (joint_types == MITER_JOINT)
+    )
+    sin = np.sin(angle)
+    sin[sin == 0] = 1
+    shift = np.where(miter, -1.0, 1.0) - np.cos(angle)
+    shift *= buff / sin
+    shift[np.abs(angle) < 1e-3] = 0
+    return shift[..., np.newaxis]
+
+
+def get_corners(controls, degrees, stroke_widths, anti_alias_width,
+                has_prev, has_next, bevel_start, bevel_end,
+                angle_from_prev, angle_to_next, joint_types):
+    n = len(degrees)
+    quadratic = degrees == 2
+    p0 = controls[:, 0]
+    p2 = controls[np.arange(n), degrees]
+    v02 = normalize2d(p2 - p0)
+    v20 = -v02
+    v10 = where2d(quadratic, normalize2d(p0 - controls[:, 1]), v20)
+    v12 = where2d(quadratic, normalize2d(p2 - controls[:, 1]), v02)
+    v01 = -v10
+    v21 = -v12
+
+    p0_perp = perp2d(v01)
+    p2_perp = perp2d(v21)
+
+    buff0 = 0.5 * stroke_widths[:, 0] + anti_alias_width
+    buff2 = 0.5 * stroke_widths[:, 2] + anti_alias_width
+    aaw0 = ((1 - has_prev) * anti_alias_width)[:, np.newaxis]
+    aaw2 = ((1 - has_next) * anti_alias_width)[:, np.newaxis]
+
+    c0 = p0 - buff0[:, np.newaxis] * p0_perp + aaw0 * v10
+    c1 = p0 + buff0[:, np.newaxis] * p0_perp + aaw0 * v10
+    c2 = p2 - buff2[:, np.newaxis] * p2_perp + aaw2 * v12
+    c3 = p2 + buff2[:, np.newaxis] * p2_perp + aaw2 * v12
+
+    # Account for previous and next curves
+    shift = has_prev[:, np.newaxis] * get_joint_shift(
+        angle_from_prev, buff0, bevel_start, joint_types
+    )
+    c0 = c0 - shift * v01
+    c1 = c1 + shift * v01
+    shift = has_next[:, np.newaxis] * get_joint_shift(
+        -angle_to_next, buff2, bevel_end, joint_types
+    )
+    c2 = c2 - shift * v21
+    c3 = c3 + shift * v21
+
+    # The linear case is the simplest, and the corners are
+    # ordered for a triangle strip
+    corners = np.stack([c0, c1, c3, c2, c2], 1)
+
+    # Make sure corners of quadratic curves form a convex hull
+    # around them, depending on which way each one bends
+    q_start = dot2d(v21, v20) > 0
+    q_end = dot2d(v01, v02) > 0
+    left = quadratic & (cross2d(v10, v12) > 0)
+    right = quadratic & ~left
+
+    change_c0 = left & q_start & should_modify_corner(c0, v01, c2, c3, v21, buff0)
+    lc0 = where2d(change_c0, p0 + p2_perp * buff0[:, np.newaxis], c0)
+    change_c3 = left & q_end & should_modify_corner(c3, v21, c1, lc0, v01, buff2)
+    lc3 = where2d(change_c3, p2 - p0_perp * buff2[:, np.newaxis], c3)
+    i12 = find_intersection(c1, v01, c2, v21)
+    corners[left] = np.stack([c1, lc0, i12, lc3, c2], 1)[left]
+
+    change_c1 = right & q_start & should_modify_corner(c1, v01, c3, c2, v21, buff0)
+    rc1 = where2d(change_c1, p0 - p2_perp * buff0[:, np.newaxis], c1)
+    change_c2 = right & q_end & should_modify_corner(c2, v21, c0, rc1, v01, buff2)
+    rc2 = where2d(change_c2, p2 + p0_perp * buff2[:, np.newaxis], c2)
+    i03 = find_intersection(c0, v01, c3, v21)
+    corners[right] = np.stack([c0, rc1, i03, rc2, c3], 1)[right]
+    return corners
+
+
+def tessellate_stroke_data(data, anti_alias_width):
+    """
+    Takes an array of stroke data, as used with the stroke geometry
+    shader, and returns triangles to be drawn with
+    quadratic_bezier_stroke_tessellated_vert.glsl
+    """
+    n_curves = len(data) // 3
+    data = data[:3 * n_curves]
+    bps = data["point"].reshape((n_curves, 3, 3))
+    prev_bps = data["prev_point"].reshape((n_curves, 3, 3))
+    next_bps = data["next_point"].reshape((n_curves, 3, 3))
+
+    with np.errstate(all="ignore"):
+        degrees, controls = get_reduced_control_points(*(
+            bps[:, i, :2].astype(np.float64) for i in range(3)
+        ))
+        keep = degrees > 0
+        bps = bps[keep]
+        prev_bps = prev_bps[keep]
+        next_bps = next_bps[keep]
+        degrees = degrees[keep]
+        controls = controls[keep]
+        n_curves = len(degrees)
+        indices = np.arange(n_curves)
+
+        stroke_widths = STROKE_WIDTH_CONVERSION * data["stroke_width"].reshape((-1, 3))[keep]
+        colors = data["color"].reshape((-1, 3, 4))[keep]
+        joint_types = data["joint_type"].reshape((-1, 3))[keep, 0]
+
+        # Information about adjacent curves
+        a_tol = 1e-10
+        ends = controls[indices, degrees]
+        prev_info = get_adjacent_info(
+            controls[:, 0], controls[:, 1] - controls[:, 0],
+            degrees, joint_types,
+            [prev_bps[:, i, :2].astype(np.float64) for i in range(3)],
+            is_prev=True,
+        )
+        next_info = get_adjacent_info(
+            ends, controls[indices, degrees - 1] - ends,
+            degrees, joint_types,
+            [next_bps[:, i, :2].astype(np.float64) for i in range(3)],
+            is_prev=False,
+        )
+        touches_prev = np.linalg.norm(prev_bps[:, 2] - bps[:, 0], axis=1) < a_tol
+        touches_next = np.linalg.norm(next_bps[:, 0] - bps[:, 2], axis=1) < a_tol
+        has_prev, bevel_start, angle_from_prev = [
+            np.where(touches_prev, arr, 0).astype(float) for arr in prev_info
+        ]
+        has_next, bevel_end, angle_to_next = [
+            np.where(touches_next, arr, 0).astype(float) for arr in next_info
+        ]
+
+        # Conversion to uv space, where the first two
+        # control points go to (0, 0) and (1, 0)
+        T = controls[:, 1] - controls[:, 0]
+        T_norm_sq = dot2d(T, T)[:, np.newaxis, np.newaxis]
+
+        def xy_to_uv(points):
+            diffs = points - controls[:, np.newaxis, 0]
+            return np.stack([dot2d(T[:, np.newaxis], diffs), cross2d(T[:, np.newaxis], diffs)], -1) / T_norm_sq
+
+        scale_factors = np.sqrt(T_norm_sq[:, 0])
+
+        corners = get_corners(
+            controls, degrees, stroke_widths, anti_alias_width,
+            has_prev, has_next, bevel_start, bevel_end,
+            angle_from_prev, angle_to_next, joint_types,
+        )
+        finite = np.isfinite(corners).all((1, 2)) & np.isfinite(scale_factors[:, 0])
+
+        # Which of the curve's 3 points each corner takes its style from
+        index_map = np.where(
+            (degrees == 1)[:, np.newaxis],
+            [0, 0, 2, 2, 2],
+            [0, 0, 1, 2, 2],
+        )
+
+        result = np.zeros((n_curves, 5), dtype=TESSELLATED_STROKE_DTYPE)
+        result["point"][:, :, :2] = corners
+        result["point"][:, :, 2] = bps[indices[:, np.newaxis], index_map, 2]
+        result["v_color"] = colors[indices[:, np.newaxis], index_map]
+        result["v_uv_coords"] = xy_to_uv(corners)
+        result["v_uv_b2"] = xy_to_uv(ends[:, np.newaxis])
+        result["v_uv_stroke_width"][..., 0] = stroke_widths[indices[:, np.newaxis], index_map] / scale_factors
+        result["v_uv_anti_alias_width"] = (anti_alias_width / scale_factors)[..., np.newaxis]
+        for name, arr in [
+            ("v_has_prev", has_prev),
+            ("v_has_next", has_next),
+            ("v_bevel_start", bevel_start),
+            ("v_bevel_end", bevel_end),
+            ("v_angle_from_prev", angle_from_prev),
+            ("v_angle_to_next", angle_to_next),
+            ("v_bezier_degree", degrees),
+        ]:
+            result[name] = arr[:, np.newaxis, np.newaxis]
+
+    return result[finite][:, STRIP_TRIANGLE_INDICES].flatten()
+
+
+def apply_instances_to_stroke_data(data, instance_data):
+    # The same placement as quadratic_bezier_stroke_instanced_vert.glsl
+    # does, with the rows of each instance matrix being its columns
+    result = np.tile(data, len(instance_data))
+    n = len(data)
+    for name in ["point", "prev_point", "next_point"]:
+        points = result[name].reshape((len(instance_data), n, 3))
+        points[:] = np.matmul(points, instance_data["instance_matrix"])
+        points += instance_data["instance_shift"][:, np.newaxis]
+    colors = result["color"].reshape((len(instance_data), n, 4))
+    colors *= instance_data["instance_color"][:, np.newaxis]
+    return result
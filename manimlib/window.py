@@ -1,3 +1,5 @@
+import time
+
 import moderngl_window as mglw
 from moderngl_window.context.pyglet.window import Window as PygletWindow
 from moderngl_window.timers.clock import Timer
@@ -15,6 +17,10 @@ class Window(PygletWindow):
     vsync = True
     samples = 1
     cursor = True
+    # How often frame stats in the title are refreshed, and how
+    # often events are handled while sleeping, in seconds
+    stats_interval = 0.5
+    event_interval = 0.01
 
     def __init__(self, scene, **kwargs):
         digest_config(self, kwargs)
@@ -28,6 +34,44 @@ class Window(PygletWindow):
         self.timer = Timer()
         self.config = mglw.WindowConfig(ctx=self.ctx, wnd=self, timer=self.timer)
         self.timer.start()
+        self.init_frame_stats()
+
+    # Frame pacing and stats
+    def init_frame_stats(self):
+        self.stats_start_time = time.time()
+        self.n_shown_frames = 0
+        self.n_dropped_frames = 0
+        self.total_draw_time = 0
+        self.max_draw_time = 0
+
+    def record_frame(self, draw_time):
+        self.n_shown_frames += 1
+        self.total_draw_time += draw_time
+        self.max_draw_time = max(self.max_draw_time, draw_time)
+        elapsed = time.time() - self.stats_start_time
+        if elapsed > self.stats_interval:
+            self.title = "{} | {:.1f} fps | draw {:.1f}ms, max {:.1f}ms | {} dropped".format(
+                self.scene,
+                self.n_shown_frames / elapsed,
+                1000 * self.total_draw_time / self.n_shown_frames,
+                1000 * self.max_draw_time,
+                self.n_dropped_frames,
+            )
+            self.init_frame_stats()
+
+    def record_dropped_frame(self):
+        self.n_dropped_frames += 1
+
+    def sleep(self, duration):
+        # Keeps handling events while waiting, so the
+        # window stays responsive through long waits
+        end_time = time.time() + duration
+        while not self.is_closing:
+            remaining = end_time - time.time()
+            if remaining <= 0:
+                break
+            time.sleep(min(remaining, self.event_interval))
+            self._window.dispatch_events()
 
     # Delegate event handling to scene
     def pixel_coords_to_space_coords(self, px, py, relative=False):
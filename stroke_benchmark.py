@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# Compares frame throughput of the geometry shader stroke pipeline
+# against strokes tessellated on the cpu.  Pass --egl to render
+# headless with EGL, e.g. on llvmpipe.
+import argparse
+import time
+
+import moderngl
+import numpy as np
+
+import manimlib.camera.camera as camera_module
+from manimlib.camera.camera import Camera
+from manimlib.constants import *
+from manimlib.mobject.geometry import Circle
+from manimlib.mobject.types.vectorized_mobject import VGroup
+
+N_FRAMES = 30
+N_CIRCLES = 200
+PIXEL_WIDTH = 1280
+PIXEL_HEIGHT = 720
+
+
+def get_mobject():
+    circles = VGroup(*[
+        Circle(radius=0.1 + 0.02 * (i % 20)).set_stroke(BLUE, 1 + i % 6)
+        for i in range(N_CIRCLES)
+    ])
+    circles.arrange_in_grid(10, 20)
+    circles.set_width(FRAME_WIDTH - 1)
+    return circles
+
+
+def get_frames_per_second(tessellate_strokes_on_cpu, n_frames):
+    camera = Camera(
+        pixel_width=PIXEL_WIDTH,
+        pixel_height=PIXEL_HEIGHT,
+        tessellate_strokes_on_cpu=tessellate_strokes_on_cpu,
+        use_background_layer=False,
+    )
+    mobject = get_mobject()
+    # First frame compiles shaders
+    camera.capture(mobject)
+    start = time.time()
+    for n in range(n_frames):
+        mobject.rotate(0.01)
+        camera.clear()
+        camera.capture(mobject)
+        camera.get_raw_fbo_data()
+    return n_frames / (time.time() - start)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--egl", action="store_true")
+    parser.add_argument("--frames", type=int, default=N_FRAMES)
+    args = parser.parse_args()
+
+    if args.egl:
+        camera_module.STANDALONE_CONTEXT = moderngl.create_standalone_context(backend="egl")
+    ctx = camera_module.get_standalone_context()
+    print(ctx.info["GL_RENDERER"])
+
+    for cpu in [False, True]:
+        fps = get_frames_per_second(cpu, args.frames)
+        name = "cpu tessellation" if cpu else "geometry shader"
+        print(f"{name}: {fps:.1f} fps")